@@ -3,16 +3,20 @@
 import asyncio
 import json
 import logging
-import pprint
-import traceback
+import re
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Form, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 
 from app.config.logging_config import get_logger
 from app.config.pydantic_config import AI_SERVICE_SETTINGS
-from app.config.store_config import StoreConfig
+from app.config.store_config import StoreConfig, get_store_config
 from app.ia_provider.provider_factory import AIProvider
 from app.models import (
     APIResponse,
@@ -39,6 +43,38 @@ logger = get_logger(__name__)
 # Create the v1 router
 api_v1_router = APIRouter(prefix="/api/v1", tags=["v1"])
 
+# Maximum number of ingredients matched per AI call in /search-stores
+SEARCH_BATCH_SIZE = 10
+
+# User-friendly messages for known AI service errors, checked in order
+_ERROR_PATTERNS = [
+    ("rate_limit", re.compile(r"rate limit", re.I), "AI service rate limit exceeded. Please try again in a few moments."),
+    ("timeout", re.compile(r"timeout", re.I), "AI service timeout. Please try again."),
+    ("authentication", re.compile(r"authentication|api key", re.I), "AI service authentication error. Please check your configuration."),
+]
+
+# Endpoint-specific messages, keyed by error kind
+_PROCESS_RECIPE_DETAILS = {
+    "timeout": "AI service timeout. Please try again with a shorter recipe or check your connection.",
+}
+
+def _user_detail(exc: Exception, action: str, overrides: Optional[dict[str, str]] = None) -> str:
+    """Map an exception to a user-friendly error message, optionally overridden per error kind."""
+    message = str(exc)
+    for kind, pattern, detail in _ERROR_PATTERNS:
+        if pattern.search(message):
+            return (overrides or {}).get(kind, detail)
+    return f"[v1] An error occurred while {action}: {message}"
+
+@lru_cache(maxsize=32)
+def _stores_payload(store_ids: tuple[str, ...]) -> tuple[Store, ...]:
+    """Build the Store models for a sequence of store ids once, keeping their order."""
+    stores = []
+    for store_id in store_ids:
+        store = get_store_config(store_id)
+        stores.append(Store.mapConfig(store.name, store.display_name, store.region, store.base_url))
+    return tuple(stores)
+
 class RecipeURL(BaseModel):
     """Model for recipe URL input."""
     url: str
@@ -48,7 +84,7 @@ class RecipeURL(BaseModel):
 async def process_recipe(url: str = Form(...)):
     """Process a recipe URL and extract ingredients."""
     try:
-        logger.info(f"[v1] Processing recipe URL: {url}")
+        logger.info("[v1] Processing recipe URL: %s", url)
         
         # Use AI service for intelligent extraction
         ai_service = get_ai_service()
@@ -56,7 +92,7 @@ async def process_recipe(url: str = Form(...)):
         # Extract recipe using AI
         response = await ai_service.extract_recipe_intelligently(url)
 
-        logger.info(f"[v1] Extracted recipe: {response['recipe'].title} with {len(response['recipe'].ingredients)} ingredients")
+        logger.info("[v1] Extracted recipe: %s with %s ingredients", response['recipe'].title, len(response['recipe'].ingredients))
 
         return APIResponse(
             success=True,
@@ -65,24 +101,14 @@ async def process_recipe(url: str = Form(...)):
         )
         
     except json.JSONDecodeError as e:
-        logger.error(f"[v1] JSON parsing error in process_recipe: {e}")
-        logger.error("Stack trace:\n" + pprint.pformat(traceback.format_exc()))
+        logger.exception("[v1] JSON parsing error in process_recipe: %s", e, extra={"exc_type": type(e).__name__})
         raise HTTPException(
             status_code=422, 
             detail="AI response was not valid JSON. This may indicate an AI service error. Please try again."
         )
     except Exception as e:
-        logger.error(f"[v1] Error processing recipe: {e}")
-        logger.error(f"[v1] Full stack trace: {traceback.format_exc()}")
-        # Provide more user-friendly error messages
-        if "rate limit" in str(e).lower():
-            detail = "AI service rate limit exceeded. Please try again in a few moments."
-        elif "timeout" in str(e).lower():
-            detail = "AI service timeout. Please try again with a shorter recipe or check your connection."
-        elif "authentication" in str(e).lower() or "api key" in str(e).lower():
-            detail = "AI service authentication error. Please check your configuration."
-        else:
-            detail = f"[v1] An error occurred while processing the recipe: {str(e)}"
+        logger.exception("[v1] Error processing recipe: %s", e, extra={"exc_type": type(e).__name__})
+        detail = _user_detail(e, "processing the recipe", _PROCESS_RECIPE_DETAILS)
         
         raise HTTPException(status_code=500, detail=detail)
 
@@ -90,7 +116,7 @@ async def process_recipe(url: str = Form(...)):
 async def search_stores(request: SearchStoresRequest) -> SearchStoresResponse:
     """Search grocery stores for ingredients."""
     try:
-        logger.info(f"[v1] Searching stores for {len(request.ingredients)} ingredients in stores: {request.stores}")
+        logger.info("[v1] Searching stores for %s ingredients in stores: %s", len(request.ingredients), request.stores)
 
         # Search all stores (or specified stores)
         stores_names = [store.lower() for store in request.stores]
@@ -101,71 +127,54 @@ async def search_stores(request: SearchStoresRequest) -> SearchStoresResponse:
         # Use AI to optimize product matching
         ai_service = get_ai_service()
 
-        # Import parallel utilities
-        from app.utils.parallel_utils import AsyncMap
-
-        async def search_product(ingredient: Ingredient):
-            """Search for a single ingredient."""
-            logger.info(f"[v1] Searching stores for ingredient: {ingredient.name}")
+        async def search_products_batch(batch: list[Ingredient]):
+            """Search for a batch of ingredients."""
+            logger.info("[v1] Searching stores for ingredients: %s", [ingredient.name for ingredient in batch])
 
-            # Search for products using AI
-            response = await ai_service.search_grocery_products_intelligently(ingredient, stores)
+            # Search for products using one AI call per store for the whole batch
+            response = await ai_service.search_grocery_products_batch(batch, stores)
 
             if logger.isEnabledFor(logging.DEBUG):
-                logger.debug((f"[v1] AI search for ingredient '{ingredient.name}' - output:", response))
-            
+                logger.debug("[v1] AI batch search - output: %s", response)
+
             return response
 
         # Process ingredients concurrently using parallel utilities
         shoppingItems = []
         ia_stats = []
-        
-        # Use AsyncMap for concurrent async operations with rate limiting
-        responses = await AsyncMap.map(
-            search_product,
-            ingredients,
-            max_concurrency=3,  # Limit concurrency to be polite to APIs
-            delay=0.5,          # 0.5 second delay between requests
+
+        # Chunk ingredients so each keeps a useful share of its batch prompt's token budget
+        batches = [ingredients[i:i + SEARCH_BATCH_SIZE] for i in range(0, len(ingredients), SEARCH_BATCH_SIZE)]
+
+        # Run batches concurrently; AI calls are bounded by the provider's AIMD limiter
+        responses = await asyncio.gather(
+            *[search_products_batch(batch) for batch in batches],
             return_exceptions=True
         )
 
         for response in responses:
             if isinstance(response, Exception):
-                logger.error(f"[v1] Error in product search: {response}")
+                logger.error("[v1] Error in product search: %s", response)
                 continue
-                
-            # Process the AI response for this product
-            logger.debug((f"[v1] AI response for product search", response))
-            shoppingItem: ShoppingListItem = response.get("shoppingItem")
-            if shoppingItem:
-                shoppingItems.append(shoppingItem)
-            
-            ai_info = response.get("ai_info", {})
-            if ai_info:
-                ia_stats.append(ai_info)
-
-        logger.info(f"[v1] Completed store search for {len(ingredients)} products")
+
+            # Process the AI response for this batch
+            logger.debug("[v1] AI response for product search: %s", response)
+            shoppingItems.extend(response.get("shoppingItems", []))
+            ia_stats.extend(response.get("ai_info", []))
+
+        logger.info("[v1] Completed store search for %s products", len(ingredients))
 
         return SearchStoresResponse(
             success=True,
-            stores=[Store.mapConfig(store.name, store.display_name, store.region, store.base_url) for store in stores],
+            stores=list(_stores_payload(tuple(store.store_id for store in stores))),
             shopping_list_items=shoppingItems,
             ia_stats=ia_stats,
             timestamp=datetime.now().isoformat()
         )
         
     except Exception as e:
-        logger.error(f"[v1] Error occurred while searching stores: {e}")
-        logger.error("Stack trace:\n" + pprint.pformat(traceback.format_exc()))
-        # Provide more user-friendly error messages
-        if "rate limit" in str(e).lower():
-            detail = "AI service rate limit exceeded. Please try again in a few moments."
-        elif "timeout" in str(e).lower():
-            detail = "AI service timeout. Please try again."
-        elif "authentication" in str(e).lower() or "api key" in str(e).lower():
-            detail = "AI service authentication error. Please check your configuration."
-        else:
-            detail = f"[v1] An error occurred while searching stores: {str(e)}"
+        logger.exception("[v1] Error occurred while searching stores: %s", e, extra={"exc_type": type(e).__name__})
+        detail = _user_detail(e, "searching stores")
         
         raise HTTPException(status_code=500, detail=detail)
 
@@ -228,54 +237,57 @@ async def clear_content_files():
         timestamp=datetime.now().isoformat()
     )
 
+# Gazpacho stub response served by the demo endpoint
+DEMO_STUB_FILE = Path(__file__).parent.parent.parent / "stub_responses" / "search_stores" / "gazpacho.json"
+
+# Validates a whole list of products in one call
+_PRODUCT_LIST_ADAPTER = TypeAdapter(list[Product])
+
+@lru_cache(maxsize=1)
+def _load_demo_response() -> SearchStoresResponse:
+    """Load and validate the demo stub response once."""
+    # Read the stub response file
+    stub_data = orjson.loads(DEMO_STUB_FILE.read_bytes())
+
+    # Map stub products to ShoppingListItem objects for frontend compatibility
+    products_data = stub_data.get("products", [])
+    products = _PRODUCT_LIST_ADAPTER.validate_python(products_data)
+
+    shopping_list_items = []
+    for product_data, product in zip(products_data, products):
+        # Build ingredient object
+        ingredient = Ingredient(
+            name=product_data.get("ingredient", product_data.get("name", "")),
+            quantity=product_data.get("quantity", 1),
+            unit=None,
+            original_text=product_data.get("name", "")
+        )
+        # Build ShoppingListItem with required quantity_needed field
+        shopping_item = ShoppingListItem(
+            ingredient=ingredient,
+            selected_product=product,
+            quantity=product_data.get("quantity", 1),
+            total_cost=product_data.get("price", 0.0)
+        )
+        shopping_list_items.append(shopping_item)
+
+    # Compose response
+    return SearchStoresResponse(
+        success=stub_data.get("success", True),
+        stores=stub_data.get("stores", []),
+        shopping_list_items=shopping_list_items,
+        ia_stats=stub_data.get("ia_stats", []),
+        timestamp=datetime.now().isoformat()
+    )
+
 @api_v1_router.get("/demo")
 async def demo_recipe() -> SearchStoresResponse:
     """Demo endpoint that returns search stores response from gazpacho stub."""
     try:
-        import os
-        from pathlib import Path
-
-        # Get the project root directory
-        current_file = Path(__file__)
-        project_root = current_file.parent.parent.parent
-        stub_file = project_root / "stub_responses" / "search_stores" / "gazpacho.json"
-        
-
-        # Read the stub response file
-        with open(stub_file, 'r', encoding='utf-8') as f:
-            stub_data = json.load(f)
-
-        # Map stub products to ShoppingListItem objects for frontend compatibility
-        shopping_list_items = []
-        for product_data in stub_data.get("products", []):
-            # Build ingredient object
-            ingredient = Ingredient(
-                name=product_data.get("ingredient", product_data.get("name", "")),
-                quantity=product_data.get("quantity", 1),
-                unit=None,
-                original_text=product_data.get("name", "")
-            )
-            # Build ShoppingListItem with required quantity_needed field
-            shopping_item = ShoppingListItem(
-                ingredient=ingredient,
-                selected_product=Product(**product_data),
-                quantity=product_data.get("quantity", 1),
-                total_cost=product_data.get("price", 0.0)
-            )
-            shopping_list_items.append(shopping_item)
-
-        # Compose response
-        response = SearchStoresResponse(
-            success=stub_data.get("success", True),
-            stores=stub_data.get("stores", []),
-            shopping_list_items=shopping_list_items,
-            ia_stats=stub_data.get("ia_stats", []),
-            timestamp=datetime.now().isoformat()
-        )
-        return response
+        return _load_demo_response().model_copy(update={"timestamp": datetime.now().isoformat()})
         
     except Exception as e:
-        logger.error(f"[v1] Error loading demo stub data: {e}")
+        logger.error("[v1] Error loading demo stub data: %s", e)
         # Fallback to empty response
         return SearchStoresResponse(
             success=False,
@@ -288,8 +300,8 @@ async def demo_recipe() -> SearchStoresResponse:
 
 @api_v1_router.post("/chat")
 
-async def chat(request: ChatCompletionRequest):
-    """Chat endpoint (placeholder)."""
+async def chat(request: ChatCompletionRequest) -> StreamingResponse:
+    """Chat endpoint streaming the AI response as server-sent events."""
 
     agent = AIProvider.create_provider(AI_SERVICE_SETTINGS.provider)
 
@@ -299,10 +311,13 @@ async def chat(request: ChatCompletionRequest):
 
     chat_params = {"messages": messages}
 
-    response = await agent.complete_chat(chat_params)
-    
-    return APIResponse(
-        success=True,
-        data=response,
-        timestamp=datetime.now().isoformat()
-    )
\ No newline at end of file
+    async def event_stream():
+        try:
+            async for delta in agent.complete_chat_stream(chat_params):
+                yield f"data: {orjson.dumps({'content': delta}).decode()}\n\n"
+        except Exception as e:
+            logger.exception("[v1] Error streaming chat response: %s", e, extra={"exc_type": type(e).__name__})
+            yield f"data: {orjson.dumps({'error': _user_detail(e, 'streaming the chat response')}).decode()}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
\ No newline at end of file
@@ -1,9 +1,8 @@
 """AI Chat Client Module"""
 
-import json
 import logging
-import traceback
 
+import orjson
 import rich
 from rich.panel import Panel
 from rich.markdown import Markdown
@@ -14,11 +13,58 @@ from app.services.tokenizer_service import TokenizerService
 from ..config.logging_config import get_logger
 from ..config.pydantic_config import AI_SERVICE_SETTINGS
 from ..config.store_config import StoreConfig
-from ..models import ChatCompletionResult, Ingredient, Product, Recipe, ShoppingListItem
+from ..models import (
+    BatchShoppingListResult,
+    ChatCompletionResult,
+    Ingredient,
+    Product,
+    Recipe,
+    ShoppingListItem,
+)
 
 # Get module logger
 logger = get_logger(__name__)
 
+# System prompts, kept byte-identical across calls so providers can reuse their prompt cache
+_RECIPE_SYS = """You are an AI assistant specialized in extracting structured recipe data from web pages.
+Your task is to analyze the provided HTML content and return a valid JSON object containing the recipe's title, ingredients (with normalized names and quantities), and instructions.
+Guidelines:
+- Output strictly valid JSON, with no extra text or comments.
+- Normalize ingredient names and quantities.
+- Include the recipe title, a list of ingredients (with name and quantity), and step-by-step instructions.
+- No ingredient should be missing or duplicated."""
+
+# Search prompts send the store content before the ingredients, so the system prompt and
+# store content form a stable prefix that providers can serve from their prompt cache.
+_SEARCH_SYS = """You are an AI assistant specialized in searching and comparing grocery products online.
+Your task is to analyze the provided grocery store and ingredients, then return a structured JSON object containing the best-matched products.
+Guidelines:
+- Search the store for the listed ingredient, considering quantity and unit.
+- Return the best-matched product with the quantity needed based on the ingredient.
+- Round up quantities as needed to meet ingredient requirements.
+- Prioritize name similarity, product relevance, brand quality, and value (price per unit).
+- Include organic or premium options where applicable.
+- Output strictly valid JSON with no extra text or comments.
+- If no suitable match is found, clearly indicate this in the output."""
+
+_SEARCH_BATCH_SYS = """You are an AI assistant specialized in searching and comparing grocery products online.
+Your task is to analyze the provided grocery store search results for a list of ingredients, then return a structured JSON object containing the best-matched product for every ingredient.
+Guidelines:
+- The store content lists each ingredient name followed by the store search results for that ingredient, one ingredient per line.
+- Return exactly one item per ingredient, in the same order as the ingredients list.
+- Return the best-matched product with the quantity needed based on the ingredient.
+- Round up quantities as needed to meet ingredient requirements.
+- Prioritize name similarity, product relevance, brand quality, and value (price per unit).
+- Output strictly valid JSON with no extra text or comments.
+- If no suitable match is found for an ingredient, leave its selected product empty."""
+
+_CHOOSE_SYS = """You are an AI assistant specialized in selecting the best grocery products across multiple stores.
+Guidelines:
+- Return the best-matched product with the quantity needed based on the ingredient.
+- Round up quantities as needed to meet ingredient requirements.
+- Output strictly valid JSON with no extra text or comments.
+- If no suitable match is found, clearly indicate this in the output."""
+
 class AIChatClient():
     """AI Chat Client for handling chat completions and recipe/product extraction."""
 
@@ -40,17 +86,8 @@ class AIChatClient():
     async def extract_recipe_data(self, html_content: str) -> ChatCompletionResult[Recipe]:
         """Extract structured recipe data from HTML using AI."""
 
-        logger.info(f"[{self.name}] Extracting recipe data using AI")
+        logger.info("[%s] Extracting recipe data using AI", self.name)
 
-        # Set system message
-        system = """You are an AI assistant specialized in extracting structured recipe data from web pages.
-        Your task is to analyze the provided HTML content and return a valid JSON object containing the recipe's title, ingredients (with normalized names and quantities), and instructions.
-        Guidelines:
-        - Output strictly valid JSON, with no extra text or comments.
-        - Normalize ingredient names and quantities.
-        - Include the recipe title, a list of ingredients (with name and quantity), and step-by-step instructions.
-        - No ingredient should be missing or duplicated.
-        """
 
         # Use centralized prompt template
         prompt = f"""Please extract the recipe details from the following HTML content and return only a valid JSON object.
@@ -63,7 +100,7 @@ class AIChatClient():
 
         chat_params = {
             "messages": [
-                {"role": "system", "content": system},
+                {"role": "system", "content": _RECIPE_SYS},
                 {"role": "user", "content": prompt}
             ],
             "response_format": Recipe
@@ -72,14 +109,13 @@ class AIChatClient():
         try:
             return await self.provider.complete_chat(chat_params)
         except Exception as e:
-            logger.error(f"[{self.name}] Error in extract_recipe_data: {e}")
-            logger.error(f"[{self.name}] Full stack trace: {traceback.format_exc()}")
+            logger.exception("[%s] Error in extract_recipe_data: %s", self.name, e)
             raise Exception("Failed to extract recipe data using AI provider.") from e
 
     async def search_best_match_products(self, ingredient: Ingredient, fetch_content: list[dict]) -> ChatCompletionResult[Product]:
         """Search grocery products for an ingredient using AI."""
 
-        logger.info(f"[{self.name}] Searching grocery products for '{ingredient.name}' using AI")
+        logger.info("[%s] Searching grocery products for '%s' using AI", self.name, ingredient.name)
 
         if logger.isEnabledFor(logging.DEBUG):
             rich.print(
@@ -91,59 +127,91 @@ class AIChatClient():
                 )
             )
             rich.print(ingredient)
-            rich.print(fetch_content)
-
 
-        store_content = json.dumps(fetch_content, separators=(",", ":"))
-
-        if not store_content or store_content == "[]":
-            logger.warning(f"[{self.name}] No store content available to search for products.")
+        if not fetch_content:
+            logger.warning("[%s] No store content available to search for products.", self.name)
             raise ValueError("No store content available to search for products.")
 
-        # Set system message
-        system = """You are an AI assistant specialized in searching and comparing grocery products online.
-        Your task is to analyze the provided grocery store and ingredients, then return a structured JSON object containing the best-matched products.
-        Guidelines:
-        - Search the store for the listed ingredient, considering quantity and unit.
-        - Return the best-matched product with the quantity needed based on the ingredient.
-        - Round up quantities as needed to meet ingredient requirements.
-        - Prioritize name similarity, product relevance, brand quality, and value (price per unit).
-        - Include organic or premium options where applicable.
-        - Output strictly valid JSON with no extra text or comments.
-        - If no suitable match is found, clearly indicate this in the output.
-        """
+        store_content = orjson.dumps(fetch_content, option=orjson.OPT_SORT_KEYS).decode()
 
-        # Use centralized prompt template
-        prompt = f"""Extract grocery the best-matched product from the store content.
-        Ingredient:
-        {ingredient}
-        Store content:
-        {store_content}
-        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] Store content: %s", self.name, store_content)
 
-        # Truncate prompt if too long
-        prompt = self._truncate_to_max_tokens(prompt)
+        store_prompt = self._truncate_to_max_tokens(f"STORE:\n{store_content}")
+        ingredient_prompt = f"INGREDIENT:\n{ingredient}\nExtract grocery the best-matched product from the store content."
 
         chat_params = {
             "messages": [
-                {"role": "system", "content": system},
-                {"role": "user", "content": prompt}
+                {"role": "system", "content": _SEARCH_SYS},
+                {"role": "user", "content": store_prompt},
+                {"role": "user", "content": ingredient_prompt}
             ],
             "response_format": Product
-            # "response_format": Product
         }
         
         try:
             return await self.provider.complete_chat(chat_params)
         except Exception as e:
-            logger.error(f"[{self.name}] Error in search_grocery_products: {e}")
-            logger.error(f"[{self.name}] Full stack trace: {traceback.format_exc()}")
+            logger.exception("[%s] Error in search_grocery_products: %s", self.name, e)
             raise Exception("Failed to extract product data using AI provider.") from e
 
+    async def search_best_match_products_batch(self, ingredients: list[Ingredient], fetch_content: dict[str, list[dict]]) -> ChatCompletionResult[BatchShoppingListResult]:
+        """Search grocery products for a batch of ingredients in one store using a single AI call."""
+
+        logger.info("[%s] Searching grocery products for %s ingredients using AI", self.name, len(ingredients))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            rich.print(
+                Panel(
+                    Markdown(f"Searching grocery products for {len(ingredients)} ingredients using AI"),
+                    title="search_best_match_products_batch",
+                    border_style="bold green",
+                    padding=(1, 2),
+                )
+            )
+            rich.print(ingredients)
+
+        if not fetch_content:
+            logger.warning("[%s] No store content available to search for products.", self.name)
+            raise ValueError("No store content available to search for products.")
+
+        # Split the token budget across ingredients, so truncation never drops a whole ingredient
+        ingredient_max_tokens = max(1, self.provider.max_tokens // len(fetch_content))
+        store_content = "\n".join(
+            self.tokenizer.truncate_to_token_limit(
+                f"{name}: {orjson.dumps(results, option=orjson.OPT_SORT_KEYS).decode()}",
+                ingredient_max_tokens
+            )
+            for name, results in fetch_content.items()
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] Store content: %s", self.name, store_content)
+
+        ingredients_content = orjson.dumps([str(ingredient) for ingredient in ingredients]).decode()
+
+        store_prompt = f"STORE:\n{store_content}"
+        ingredients_prompt = f"INGREDIENTS:\n{ingredients_content}\nExtract grocery the best-matched product for each ingredient from the store content."
+
+        chat_params = {
+            "messages": [
+                {"role": "system", "content": _SEARCH_BATCH_SYS},
+                {"role": "user", "content": store_prompt},
+                {"role": "user", "content": ingredients_prompt}
+            ],
+            "response_format": BatchShoppingListResult
+        }
+
+        try:
+            return await self.provider.complete_chat(chat_params)
+        except Exception as e:
+            logger.exception("[%s] Error in search_best_match_products_batch: %s", self.name, e)
+            raise Exception("Failed to extract batch product data using AI provider.") from e
+
     async def choose_best_product_in_stores(self, ingredient: Ingredient, store_candidates: dict[str, Product]) -> ChatCompletionResult[ShoppingListItem]:
         """Choose the best product across multiple stores for an ingredient using AI."""
 
-        logger.info(f"[{self.name}] Choosing best product across stores for '{ingredient.name}' using AI")
+        logger.info("[%s] Choosing best product across stores for '%s' using AI", self.name, ingredient.name)
 
         if logger.isEnabledFor(logging.DEBUG):
             rich.print(
@@ -158,21 +226,12 @@ class AIChatClient():
             rich.print(store_candidates)
 
         # Serialize Product objects to dict before dumping to JSON
-        candidates = json.dumps({store: product.model_dump() for store, product in store_candidates.items()}, separators=(",", ":"))
+        candidates = orjson.dumps({store: product.model_dump() for store, product in store_candidates.items()}).decode()
 
         if not candidates or candidates == "[]":
-            logger.warning(f"[{self.name}] No store content available to choose best product.")
+            logger.warning("[%s] No store content available to choose best product.", self.name)
             raise ValueError("No store content available to choose best product.")
 
-        # Set system message
-        system = """You are an AI assistant specialized in selecting the best grocery products across multiple stores.
-        Guidelines:
-        - Return the best-matched product with the quantity needed based on the ingredient.
-        - Round up quantities as needed to meet ingredient requirements.
-        - Output strictly valid JSON with no extra text or comments.
-        - If no suitable match is found, clearly indicate this in the output.
-        """
-
         # Use centralized prompt template
         prompt = f"""Extract grocery the best-matched product from the store content.
         Ingredient:
@@ -186,7 +245,7 @@ class AIChatClient():
 
         chat_params = {
             "messages": [
-                {"role": "system", "content": system},
+                {"role": "system", "content": _CHOOSE_SYS},
                 {"role": "user", "content": prompt}
             ],
             "response_format": ShoppingListItem
@@ -195,8 +254,7 @@ class AIChatClient():
         try:
             return await self.provider.complete_chat(chat_params)
         except Exception as e:
-            logger.error(f"[{self.name}] Error in choose_best_product_in_stores: {e}")
-            logger.error(f"[{self.name}] Full stack trace: {traceback.format_exc()}")
+            logger.exception("[%s] Error in choose_best_product_in_stores: %s", self.name, e)
             raise Exception("Failed to choose product data using AI provider.") from e
 
     async def close(self):
@@ -1,13 +1,13 @@
-import json
-
 """
 Centralized logging configuration for the AI Recipe Shoplist Crawler.
 """
 
 import logging
 import os
+import sys
 from typing import Optional
 
+import orjson
 from rich.console import Console
 from rich.logging import RichHandler
 
@@ -27,7 +27,7 @@ class RichJSONFormatter(logging.Formatter):
                 # print("---------- DEBUG: RichJSONFormatter detected tuple/list with dict -----------")
                 try:
                     based_truncated = base.split(str(message))[0]
-                    json_pretty = json.dumps(message[1], indent=2, ensure_ascii=False, default=str)
+                    json_pretty = _pretty_json(message[1])
                     # Only print the pretty JSON, not the tuple/list as a string
                     return f"{based_truncated}{message[0]}\n{json_pretty}"
                 except Exception:
@@ -39,8 +39,7 @@ class RichJSONFormatter(logging.Formatter):
                 # print("---------- DEBUG: RichJSONFormatter detected tuple/list with str -----------")
                 try:
                     based_truncated = base.split(str(message))[0]
-                    parsed = json.loads(message[1])
-                    pretty = json.dumps(parsed, indent=2, ensure_ascii=False, default=str)
+                    pretty = _pretty_json(orjson.loads(message[1]))
                     # Only print the pretty JSON, not the tuple/list as a string
                     return f"{based_truncated}{message[0]}\n{pretty}"
                 except Exception:
@@ -51,7 +50,7 @@ class RichJSONFormatter(logging.Formatter):
             # print("---------- DEBUG: RichJSONFormatter detected dict -----------")
             try:
                 based_truncated = base.split(str(message))[0]
-                json_pretty = json.dumps(message, indent=2, ensure_ascii=False, default=str)
+                json_pretty = _pretty_json(message)
                 # Only print the pretty JSON, not the dict as a string
                 return f"{based_truncated}\n{json_pretty}"
             except Exception:
@@ -60,18 +59,48 @@ class RichJSONFormatter(logging.Formatter):
         # If message is a JSON string, pretty-print it after the base log
         try:
             # print("---------- DEBUG: RichJSONFormatter detected JSON string -----------")
-            parsed = json.loads(record.getMessage())
-            pretty = json.dumps(parsed, indent=2, ensure_ascii=False, default=str)
+            pretty = _pretty_json(orjson.loads(record.getMessage()))
             return f"{base}\n{pretty}"
-        except (json.JSONDecodeError, TypeError):
+        except (orjson.JSONDecodeError, TypeError):
             return base
 
+def _pretty_json(data) -> str:
+    """Pretty-print data as indented JSON, stringifying unsupported types."""
+    return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+# Attributes present on every LogRecord, everything else was passed via `extra`
+_RESERVED_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+class JSONFormatter(logging.Formatter):
+    """Formatter that renders each log record as a single orjson-encoded JSON line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+
+        # Structured fields passed with logger.info(..., extra={...})
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_RECORD_ATTRS:
+                entry[key] = value
+
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+
+        return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
 def setup_logging(
     level: Optional[str] = None,
     debug: Optional[bool] = None,
     format_string: Optional[str] = None,
     file_logging_enabled: bool = False,
-    log_file: str = "app.log"
+    log_file: str = "app.log",
+    json_format: Optional[bool] = None
 ) -> logging.Logger:
     """
     Configure application logging with environment-based settings.
@@ -82,6 +111,7 @@ def setup_logging(
         format_string: Custom log format string
         file_logging_enabled: Whether to enable file logging
         log_file: Log file path (only used if file_logging_enabled=True)
+        json_format: Emit one JSON object per line instead of Rich console output
     
     Returns:
         Configured logger instance
@@ -90,6 +120,7 @@ def setup_logging(
     # Get configuration from environment or parameters
     debug_enabled = debug if debug is not None else os.getenv("LOG_DEBUG_ENABLED", "false").lower() in ("true", "1", "yes")
     log_level = level or os.getenv("LOG_LEVEL", "info").upper()
+    json_enabled = json_format if json_format is not None else os.getenv("LOG_JSON_FORMAT", "false").lower() in ("true", "1", "yes")
     
     # Default format string
     if format_string is None:
@@ -106,16 +137,18 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
 
-    # Setup Rich console
-    console = Console()
+    if json_enabled:
+        # Structured JSON lines, cheap to render and to ingest
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(JSONFormatter())
+    else:
+        # Create rich handler with custom JSON formatter
+        console_handler = RichHandler(console=Console(), show_time=True, show_level=True, markup=True)
+        console_handler.setFormatter(RichJSONFormatter(format_string))
+    console_handler.setLevel(numeric_level)
 
-    # Create rich handler with custom JSON formatter
-    rich_handler = RichHandler(console=console, show_time=True, show_level=True, markup=True)
-    rich_handler.setLevel(numeric_level)
-    rich_handler.setFormatter(RichJSONFormatter(format_string))
-    
     # Add handler to root logger
-    root_logger.addHandler(rich_handler)
+    root_logger.addHandler(console_handler)
     root_logger.setLevel(numeric_level)
     
     # # Console handler
@@ -136,7 +169,7 @@ def setup_logging(
         
         # Create file handler with append mode
         file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
-        file_handler.setFormatter(logging.Formatter(format_string))
+        file_handler.setFormatter(JSONFormatter() if json_enabled else logging.Formatter(format_string))
         file_handler.setLevel(numeric_level)
         root_logger.addHandler(file_handler)
     
@@ -233,6 +266,8 @@ def log_function_call(func_name: str, args: dict = None, level: int = logging.DE
         level: Log level to use
     """
     logger = get_logger(__name__)
+    if not logger.isEnabledFor(level):
+        return
     
     if args:
         # Sanitize sensitive data
@@ -285,6 +320,7 @@ LOG_DEBUG_ENABLED = os.getenv("DEBUG", "false").lower() in ("true", "1", "yes")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_FILE_ENABLED = os.getenv("LOG_FILE_ENABLED", "false").lower() in ("true", "1", "yes")
 LOG_FILE_PATH = os.getenv("LOG_FILE_PATH", "logs/app.log")
+LOG_JSON_FORMAT = os.getenv("LOG_JSON_FORMAT", "false").lower() in ("true", "1", "yes")
 
 # Initialize logging on import (can be overridden later)
 if not logging.getLogger().handlers:
@@ -292,5 +328,6 @@ if not logging.getLogger().handlers:
         level=LOG_LEVEL,
         debug=LOG_DEBUG_ENABLED,
         file_logging_enabled=LOG_FILE_ENABLED,
-        log_file=LOG_FILE_PATH
+        log_file=LOG_FILE_PATH,
+        json_format=LOG_JSON_FORMAT
     )
\ No newline at end of file
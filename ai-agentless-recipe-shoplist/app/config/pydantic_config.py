@@ -25,6 +25,7 @@ class WebFetcherSettings(BaseSettings):
 class HTMLScraperSettings(BaseSettings):
     """Web scraper configuration settings."""
     html_to_text: bool = Field(default=False, description="Convert HTML content to text after extraction")
+    trace: bool = Field(default=False, description="Print scraped responses in debug mode (slow on large payloads)")
 
     model_config = ConfigDict(env_prefix="WEB_SCRAPER_")
 
@@ -181,8 +182,13 @@ class CacheSettings(BaseSettings):
 class DBManagerSettings(BaseSettings):
     """Database manager configuration settings."""
 
-    path: str = Field(default="tmp/shoplist.db", description="Path to the database file")
+    path: str = Field(default="tmp/shoplist.sqlite3", description="Path to the SQLite database file")
     enabled: bool = Field(default=True, description="Enable database storage")
+    batch_size: int = Field(default=50, description="Number of buffered writes per database commit")
+    memory_cache_size: int = Field(default=1024, description="Number of decoded entries kept in memory")
+    statement_cache_size: int = Field(default=128, description="Number of prepared SQL statements cached per connection")
+    write_queue_size: int = Field(default=1024, description="Maximum number of saves queued for the background writer")
+    compress_threshold: int = Field(default=4096, description="Entries larger than this many bytes are stored compressed")
 
     model_config = ConfigDict(env_prefix="DB_")
 
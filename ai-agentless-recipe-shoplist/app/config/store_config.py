@@ -3,12 +3,14 @@ Store configuration for grocery store crawlers.
 Contains store metadata, URLs, and search parameters.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any, Optional
+from urllib.parse import quote_plus
 
 from app.config.pydantic_config import RAPID_API_SETTINGS
-from urllib.parse import urlencode
+from app.utils.json_extractor import JSONExtractor
 
 
 class StoreRegion(str, Enum):
@@ -51,17 +53,33 @@ class StoreConfig:
     # Request settings
     request_rate_limit_delay: float = 1.0
     request_timeout: int = 30
+    request_max_concurrency: int = 4  # Max in-flight searches against this store
     request_user_agent: Optional[str] = None
     
     # Selectors for web scraping for search_type: "html"
     html_selectors: Optional[dict[str, str]] = None
-    
+
+    # Precomputed "&k=v" tail of the static search params
+    _params_tail: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self):
+        """Precompute the encoded static search params once per store."""
+        self._params_tail = "".join(
+            f"&{quote_plus(str(key))}={quote_plus(str(value))}"
+            for key, value in (self.search_params or {}).items()
+            if key != self.search_query_param
+        )
+
+    @cached_property
+    def json_extractor(self) -> Optional[JSONExtractor]:
+        """JSON extractor for API search results, compiled once per store."""
+        if self.search_api_result_jsonrules is None:
+            return None
+        return JSONExtractor(self.search_api_result_jsonrules)
+
     def get_search_url(self, query: str) -> str:
         """Generate search URL for a query."""
-        params = self.get_query_params(query)
-        params_str = urlencode(params)
-
-        return f"{self.search_url}?{params_str}"
+        return f"{self.search_url}?{self.search_query_param}={quote_plus(query)}{self._params_tail}"
     
     def get_query_params(self, query: str) -> dict:
         """Generate product query string."""
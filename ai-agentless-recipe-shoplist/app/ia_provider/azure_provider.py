@@ -5,7 +5,7 @@ import azure.identity.aio
 from ..config.logging_config import get_logger
 from ..config.pydantic_config import AZURE_SETTINGS
 from ..utils.retry_utils import AIRetryConfig, create_ai_retry_config
-from .base_provider import BaseAIProvider
+from .base_provider import BaseAIProvider, get_http_client
 
 # Azure OpenAI imports
 try:
@@ -41,7 +41,8 @@ class AzureProvider(BaseAIProvider):
         self._client = openai.AsyncAzureOpenAI(
             api_key=AZURE_SETTINGS.api_key,
             azure_endpoint=AZURE_SETTINGS.endpoint,
-            api_version=AZURE_SETTINGS.api_version
+            api_version=AZURE_SETTINGS.api_version,
+            http_client=get_http_client()
         )
         self._retry_config = create_ai_retry_config(self.name)
 
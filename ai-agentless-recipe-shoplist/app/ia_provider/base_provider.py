@@ -1,12 +1,17 @@
 """Base AI provider abstract class and common utilities."""
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
-import traceback
+from typing import AsyncIterator, Optional
+
+import httpx
 
 from app.storage.storage_manager import get_storage_manager
 
 from ..config.logging_config import get_logger, log_function_call
 from ..models import ChatCompletionResult
+from ..utils.aimd_limiter import get_aimd_limiter
 from ..utils.ai_helpers import (
     get_ai_token_stats,
     log_ai_chat_query,
@@ -23,9 +28,31 @@ from ..utils.retry_utils import (
     NetworkError,
     RateLimitError,
     ServerError,
+    get_rate_limit_state,
     with_ai_retry,
 )
 
+# Shared pooled HTTP client for all OpenAI-compatible providers
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP/2 client used by the AI provider SDKs."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(30.0),
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release its connection pool."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
 
 class BaseAIProvider(ABC):
     """Complete a chat conversation using AI Models with tenacity retry logic."""
@@ -33,6 +60,9 @@ class BaseAIProvider(ABC):
     def __init__(self):
         # Initialize cache manager and content storage
         self.content_storage = get_storage_manager()
+
+        # Proactive rate limit tracking from response headers
+        self.rate_limit_state = get_rate_limit_state(self.name)
         
         # self.cache_manager = CacheManager(ttl=CACHE_SETTINGS.ai_ttl)  # Separate TTL for AI responses
         # self.content_storage = BlobManager(BLOB_SETTINGS.base_path / "ai_cache") # Separate storage path for AI responses
@@ -67,6 +97,52 @@ class BaseAIProvider(ABC):
         """Each child must define a retry configuration"""
         pass
 
+    def _get_cache_key(self, params: dict) -> str:
+        """Build a short, stable cache key for the chat request parameters."""
+        model_class = params.get("response_format", None)
+        key_bytes = json.dumps({
+            "m": self.model,
+            "rf": getattr(model_class, "__name__", None),
+            "msgs": params.get("messages", [])
+        }, separators=(",", ":"), sort_keys=True, default=str).encode()
+        return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+
+    async def complete_chat_stream(self, params: dict, **kwargs) -> AsyncIterator[str]:
+        """Stream a chat conversation, yielding content deltas as they arrive."""
+
+        max_tokens = kwargs.get("max_tokens", self.max_tokens)
+        temperature = kwargs.get("temperature", self.temperature)
+
+        log_function_call("BaseAIProvider.complete_chat_stream", {
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        })
+
+        chat_params = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            **params
+        }
+
+        log_ai_chat_query(self.name, chat_params, logger)
+
+        if not AI_SERVICE_SETTINGS.provider_chat_enabled:
+            logger.warning("[%s] AI provider chat calls are disabled. Skipping API call.", self.name)
+            return
+
+        # Wait when the provider budget is nearly exhausted
+        await self.rate_limit_state.wait_if_throttled()
+
+        try:
+            stream = await self.client.chat.completions.create(**chat_params, stream=True)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            log_ai_error(self.name, e, logger)
+            raise
+
     async def complete_chat(self, params: any, **kwargs) -> ChatCompletionResult:
         """Complete a chat conversation."""
         
@@ -91,16 +167,24 @@ class BaseAIProvider(ABC):
                 log_ai_chat_query(self.name, chat_params, logger)
 
                 if not AI_SERVICE_SETTINGS.provider_chat_enabled:
-                    logger.warning(f"[{self.name}] AI provider chat calls are disabled. Skipping API call.")
+                    logger.warning("[%s] AI provider chat calls are disabled. Skipping API call.", self.name)
                     return ChatCompletionResult(
                         success=False,
                         refusal="AI provider chat calls are disabled.",
                     )
                 
-                if "response_format" in chat_params:
-                    response = await self.client.chat.completions.parse(**chat_params)
-                else:
-                    response = await self.client.chat.completions.create(**chat_params)
+                # Wait when the provider budget is nearly exhausted
+                await self.rate_limit_state.wait_if_throttled()
+
+                # Bound concurrent provider calls; successful call latencies grow the window
+                async with get_aimd_limiter().slot():
+                    if "response_format" in chat_params:
+                        raw_response = await self.client.chat.completions.with_raw_response.parse(**chat_params)
+                    else:
+                        raw_response = await self.client.chat.completions.with_raw_response.create(**chat_params)
+
+                self.rate_limit_state.update_from_headers(raw_response.headers)
+                response = raw_response.parse()
 
                 log_ai_chat_response(self.name, response, logger)
                 
@@ -119,30 +203,38 @@ class BaseAIProvider(ABC):
                 # Convert provider-specific errors to our retry framework
                 error_str = str(e).lower()
                 if "rate limit" in error_str or "429" in error_str:
+                    self.rate_limit_state.update_from_headers(getattr(getattr(e, "response", None), "headers", None))
+                    get_aimd_limiter().on_congestion()
                     raise RateLimitError(f"{self.name} rate limit: {e}")
                 elif any(keyword in error_str for keyword in ["server", "503", "502", "500"]):
+                    get_aimd_limiter().on_congestion()
                     raise ServerError(f"{self.name} server error: {e}")
                 elif any(keyword in error_str for keyword in ["timeout", "connection"]):
+                    if "timeout" in error_str:
+                        get_aimd_limiter().on_congestion()
                     raise NetworkError(f"{self.name} network error: {e}")
                 else:
                     raise
                 
         try:
             # Check cache first
-            data_key = next((msg["content"] for msg in params.get("messages", []) if msg.get("role") == "user"), str(params))
+            data_key = self._get_cache_key(params)
             model_class = params.get("response_format", None)
             
-            # Try to load from cache or storage
-            loaded_response = await self.content_storage.load_ai_response(key=data_key, alias=self.name, model_class=model_class)
+            # Try to load from cache or storage, or reserve the key for this request
+            loaded_response, lease = await self.content_storage.get_or_reserve(key=data_key, alias=self.name, model_class=model_class)
             if loaded_response:
-                logger.info(f"[{self.name}] Loaded AI response from cache/storage for model_class: {model_class}")
+                logger.info("[%s] Loaded AI response from cache/storage for model_class: %s", self.name, model_class)
                 return loaded_response
 
-            # Make AI chat completion request
-            response: ChatCompletionResult = await chat_completion_request()
+            try:
+                # Make AI chat completion request
+                response: ChatCompletionResult = await chat_completion_request()
 
-            # Save responses
-            await self.content_storage.save_ai_response(key=data_key, data=response, alias=self.name, format="json")
+                # Save responses and share them with concurrent identical requests
+                await lease.complete(response, format="json")
+            finally:
+                lease.release()
 
             return response
         except Exception as e:
@@ -150,4 +242,9 @@ class BaseAIProvider(ABC):
             raise
             
     async def close(self):
-        await self._client.aclose()
\ No newline at end of file
+        """
+        Release resources owned by this provider.
+
+        SDK clients wrap the HTTP pool shared by every cached provider, so they
+        are left open here; main.py closes the pool on shutdown via close_http_client().
+        """
\ No newline at end of file
@@ -3,7 +3,7 @@
 from ..config.logging_config import get_logger
 from ..config.pydantic_config import GITHUB_SETTINGS
 from ..utils.retry_utils import AIRetryConfig, create_ai_retry_config
-from .base_provider import BaseAIProvider
+from .base_provider import BaseAIProvider, get_http_client
 
 try:
     import openai
@@ -30,7 +30,11 @@ class GitHubProvider(BaseAIProvider):
         logger.debug(f"[{self.name}] Initializing GitHub Models provider...")
 
         # Initialize OpenAI Async Client for GitHub Models
-        self._client = openai.AsyncOpenAI(base_url=GITHUB_SETTINGS.api_url, api_key=GITHUB_SETTINGS.token)
+        self._client = openai.AsyncOpenAI(
+            base_url=GITHUB_SETTINGS.api_url,
+            api_key=GITHUB_SETTINGS.token,
+            http_client=get_http_client()
+        )
         self._retry_config = create_ai_retry_config(self.name)
 
         # Mask token for logging
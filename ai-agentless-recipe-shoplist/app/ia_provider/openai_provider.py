@@ -3,7 +3,7 @@
 from ..config.logging_config import get_logger
 from ..config.pydantic_config import OPENAI_SETTINGS
 from ..utils.retry_utils import AIRetryConfig, create_ai_retry_config
-from .base_provider import BaseAIProvider
+from .base_provider import BaseAIProvider, get_http_client
 
 try:
     import openai
@@ -28,7 +28,7 @@ class OpenAIProvider(BaseAIProvider):
             raise ValueError("OPENAI_API_KEY environment variable not set")
 
         # Initialize OpenAI Async Client
-        self._client = openai.AsyncOpenAI(api_key=OPENAI_SETTINGS.api_key)
+        self._client = openai.AsyncOpenAI(api_key=OPENAI_SETTINGS.api_key, http_client=get_http_client())
         self._retry_config = create_ai_retry_config(self.name)
         
         # Mask token for logging
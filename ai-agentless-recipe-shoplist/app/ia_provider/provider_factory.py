@@ -1,5 +1,6 @@
 """AI Provider Factory Module"""
 from enum import Enum
+from functools import lru_cache
 
 from app.ia_provider.base_provider import BaseAIProvider
 
@@ -26,20 +27,25 @@ class AIProvider(str, Enum):
 
     @staticmethod
     def create_provider(provider_name: str) -> BaseAIProvider:
-        """Create AI provider based on configuration."""
-        provider_map = {
-            AIProvider.OPENAI: OpenAIProvider,
-            AIProvider.AZURE: AzureProvider,
-            AIProvider.OLLAMA: OllamaProvider,
-            AIProvider.GITHUB: GitHubProvider,
-            AIProvider.STUB: StubProvider,
-        }
-        
-        if provider_name not in provider_map:
-            raise ValueError(f"Unknown AI provider: {provider_name}")
-        
-        try:
-            return provider_map[provider_name]()
-        except Exception as e:
-            print(f"[AIProvider] Error initializing {provider_name} provider: {e}")
-            raise
\ No newline at end of file
+        """Create AI provider based on configuration, once per provider name."""
+        return _create_provider(getattr(provider_name, "value", provider_name))
+
+_PROVIDER_MAP: dict[AIProvider, type[BaseAIProvider]] = {
+    AIProvider.OPENAI: OpenAIProvider,
+    AIProvider.AZURE: AzureProvider,
+    AIProvider.OLLAMA: OllamaProvider,
+    AIProvider.GITHUB: GitHubProvider,
+    AIProvider.STUB: StubProvider,
+}
+
+@lru_cache(maxsize=8)
+def _create_provider(provider_name: str) -> BaseAIProvider:
+    """Instantiate the provider for a (normalized) provider name."""
+    if provider_name not in _PROVIDER_MAP:
+        raise ValueError(f"Unknown AI provider: {provider_name}")
+    
+    try:
+        return _PROVIDER_MAP[provider_name]()
+    except Exception as e:
+        print(f"[AIProvider] Error initializing {provider_name} provider: {e}")
+        raise
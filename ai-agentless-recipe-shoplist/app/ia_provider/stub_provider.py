@@ -4,11 +4,12 @@ This provider serves mock/stub responses instead of making real AI API calls.
 Useful for development, testing, and demonstrations without API costs.
 """
 
-import json
 import random
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from ..config.logging_config import get_logger
 from .base_provider import BaseAIProvider
 
@@ -48,11 +49,11 @@ class StubProvider(BaseAIProvider):
                 
                 for response_file in category_dir.glob("*.json"):
                     try:
-                        with open(response_file, 'r', encoding='utf-8') as f:
-                            response_data = json.load(f)
-                            response_name = response_file.stem
-                            self.response_cache[category_name][response_name] = response_data
-                            logger.debug(f"Loaded mock response: {category_name}/{response_name}")
+                        # Parse straight from bytes, without decoding to str first
+                        response_data = orjson.loads(response_file.read_bytes())
+                        response_name = response_file.stem
+                        self.response_cache[category_name][response_name] = response_data
+                        logger.debug(f"Loaded mock response: {category_name}/{response_name}")
                     except Exception as e:
                         logger.error(f"Error loading mock response {response_file}: {e}")
     
@@ -69,13 +70,13 @@ class StubProvider(BaseAIProvider):
         
         # Return contextual stub responses
         if "recipe" in user_message or "ingredient" in user_message:
-            return json.dumps(self._get_recipe_stub_response())
+            return orjson.dumps(self._get_recipe_stub_response()).decode()
         elif "shop" in user_message or "store" in user_message:
-            return json.dumps(self._get_shopping_stub_response())
+            return orjson.dumps(self._get_shopping_stub_response()).decode()
         elif "bill" in user_message or "cost" in user_message:
-            return json.dumps(self._get_bill_stub_response())
+            return orjson.dumps(self._get_bill_stub_response()).decode()
         else:
-            return json.dumps({"response": "This is a stub response for development/testing"})
+            return orjson.dumps({"response": "This is a stub response for development/testing"}).decode()
     
     async def extract_recipe_data(self, html_content: str, url: str) -> dict[str, Any]:
         """Extract structured recipe data using stub responses."""
@@ -2,6 +2,7 @@
 
 import logging
 import os
+import sys
 from contextlib import asynccontextmanager
 from datetime import datetime
 
@@ -32,7 +33,11 @@ logger = setup_logging(
 )
 
 # Import services
+from app.ia_provider.base_provider import close_http_client
+from app.scrapers.html_scraper import get_html_scraper
 from app.services.ai_service import get_ai_service
+from app.services.web_fetcher import get_web_fetcher
+from app.storage.db_manager import get_db_manager
 
 # Try to import Jinja2Templates, make it optional
 try:
@@ -60,6 +65,15 @@ async def lifespan(app: FastAPI):
     logger.info("[App] Application startup complete")
     yield
 
+    # Finish pending background storage saves
+    await get_html_scraper().flush()
+    await get_db_manager().drain()
+
+    # Release pooled HTTP connections on shutdown
+    await get_web_fetcher().close()
+    await close_http_client()
+    logger.info("[App] Application shutdown complete")
+
 # Initialize FastAPI app with lifespan
 app = FastAPI(
     title="AI Recipe Shoplist Crawler",
@@ -159,5 +173,8 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # uvloop and httptools ship with uvicorn[standard] (uvloop is not available on Windows)
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
\ No newline at end of file
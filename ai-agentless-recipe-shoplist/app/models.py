@@ -1,10 +1,11 @@
 """Data models for the recipe shoplist application."""
 
 from enum import Enum
+from functools import cache
 from typing import Any, Generic, Optional, TypeVar
 
 import rich
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class QuantityUnit(str, Enum):
@@ -47,6 +48,21 @@ class QuantityUnit(str, Enum):
 
     DEFAULT = UNIT
 
+    @classmethod
+    def from_str(cls, value: Any) -> "QuantityUnit":
+        """Map a unit value or name (any case) to a unit, falling back to DEFAULT."""
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, str):
+            return cls.DEFAULT
+        return _UNIT_LOOKUP.get(value.strip().lower(), cls.DEFAULT)
+
+# Unit lookup by lowercase value and member name, e.g. "tbsp" and "tablespoon"
+_UNIT_LOOKUP: dict[str, QuantityUnit] = {
+    **{name.lower(): member for name, member in QuantityUnit.__members__.items()},
+    **{member.value: member for member in QuantityUnit},
+}
+
 class Ingredient(BaseModel):
     """Represents a recipe ingredient with quantity and unit."""
     name: str = Field(..., description="Normalised australian name of the ingredient without adjectives")
@@ -60,10 +76,18 @@ class Ingredient(BaseModel):
     quality: Optional[str] = Field(None, description="Quality descriptor (e.g., organic, fresh)")
     brand_preference: Optional[str] = Field(None, description="Preferred brand for the ingredient")
 
+    @field_validator("unit", mode="before")
+    @classmethod
+    def _coerce_unit(cls, value: Any) -> Optional[QuantityUnit]:
+        """Coerce AI-provided units with a dict lookup, defaulting unknown units and keeping an explicit None."""
+        if value is None:
+            return None
+        return QuantityUnit.from_str(value)
+
     def __str__(self) -> str:
         name_str = self.name
         qty_str = f": {self.quantity or 1} "
-        unit_str = f"{self.unit.value} "
+        unit_str = f"{self.unit.value} " if self.unit else ""
         brand_str = f"(Preference brand: {self.brand_preference}) " if self.brand_preference else ""
         category_str = f"({self.category})" if self.category else ""
         alternatives_str = f" Alternatives: {', '.join(self.alternatives)}." if self.alternatives else ""
@@ -82,8 +106,9 @@ class Recipe(BaseModel):
     image_url: Optional[str] = Field(None, description="Recipe image URL")
 
     @staticmethod
+    @cache
     def default() -> "Recipe":
-        """Returns a default example recipe."""
+        """Returns the shared default example recipe (do not mutate it)."""
         return Recipe(
             title="Example Recipe",
             url="http://example.com/recipe",
@@ -108,12 +133,14 @@ class Product(BaseModel):
     ia_reasoning: Optional[str] = Field(None, description="Short AI reasoning for product selection")
 
     @staticmethod
+    @cache
     def default() -> "Product":
-        """Returns a default example product."""
+        """Returns the shared default example product (do not mutate it)."""
         return Product(
             name="Example Product",
             ingredient="Example Ingredient",
             price=0.0,
+            price_unit="item",
             store="Example Store"
         )
 
@@ -141,8 +168,9 @@ class ShopphingCart(BaseModel):
     store: str = Field(..., description="Store name")
 
     @staticmethod
+    @cache
     def default() -> "ShopphingCart":
-        """Returns a default example shopping cart."""
+        """Returns the shared default example shopping cart (do not mutate it)."""
         return ShopphingCart(
             products=[],
             total_price=0.0,
@@ -169,6 +197,10 @@ class ShoppingListItem(BaseModel):
     total_cost: Optional[float] = Field(None, description="Total cost is based on quantity plus product price")
     store_options: Optional[dict[str, Product]] = Field(None, description="Available products from different stores, only one per store")
 
+class BatchShoppingListResult(BaseModel):
+    """Shopping list items matched for a batch of ingredients in a single store."""
+    items: list[ShoppingListItem] = Field(default_factory=list, description="One shopping list item per ingredient, in the same order as the ingredients")
+
 # class OptimizationResult(BaseModel):
 #     """Result of price optimization across stores."""
 #     items: list[ShoppingListItem] = Field(..., description="Optimized shopping list")
@@ -186,6 +218,10 @@ class APIResponse(BaseModel):
 T = TypeVar('T')
 class ChatCompletionResult(BaseModel, Generic[T]):
     """Response from an AI service, including raw content, parsed result, refusal info, and stats."""
+    # Parameterizations such as ChatCompletionResult[Recipe] are only used as type
+    # annotations, so only build their schemas if they are ever validated
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = Field(..., description="Whether the AI call was successful")
     content: Optional[T] = Field(..., description="Content returned by the AI service")
     refusal: Optional[Any] = Field(None, description="Refusal information if applicable")
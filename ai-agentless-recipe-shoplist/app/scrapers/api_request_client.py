@@ -1,12 +1,15 @@
 import logging
+from itertools import islice
 
-import requests
-import rich
+import httpx
+import orjson
+from rich.pretty import pprint
 
 from app.config.store_config import StoreConfig
-from app.utils.json_extractor import JSONExtractor
+from app.services.web_fetcher import get_web_fetcher
 
 from ..config.logging_config import get_logger, log_function_call
+from ..config.pydantic_config import WEB_SCRAPER_SETTINGS
 
 logger = get_logger(__name__)
 
@@ -15,26 +18,28 @@ class ApiResquetClient:
         self.name = api_name
         logger.debug(f"Initialized {self.name}")
 
-    async def fetch_json_data(self, url: str, headers: dict = None, params: dict = None) -> dict:
+    async def fetch_json_data(self, url: str, headers: dict = None, params: dict = None, timeout: float = None) -> dict:
         try:
 
-            log_function_call(f"{self.name}.fetch", {
-                "url": url,
-                "headers": headers,
-                "params": params
-            })
+            if logger.isEnabledFor(logging.DEBUG):
+                log_function_call(f"{self.name}.fetch", {
+                    "url": url,
+                    "headers": headers,
+                    "params": params
+                })
 
-            # Make the GET request
-            response = requests.get(url, headers=headers, params=params)
+            # Make the GET request without blocking the event loop
+            client = get_web_fetcher().client
+            response = await client.get(url, headers=headers, params=params, timeout=timeout or httpx.USE_CLIENT_DEFAULT)
 
             # Check if request was successful
             response.raise_for_status()
             
             # Parse JSON response
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Response data keys: {list(data.keys())}")
+            if logger.isEnabledFor(logging.DEBUG) and isinstance(data, dict):
+                logger.debug("Response data keys: %s", ", ".join(islice(data, 10)))
 
             return data
 
@@ -54,15 +59,15 @@ class ApiResquetClient:
         logger.info(f"[{self.name}] Scraping URL: {url} with params: {params}")
 
         # Make the API request
-        result = await self.fetch_json_data(url, headers=headers, params=params)
+        result = await self.fetch_json_data(url, headers=headers, params=params, timeout=store_config.request_timeout)
 
         # Log response data for debugging
-        if logger.isEnabledFor(logging.DEBUG):
-            rich.print(result)
+        if WEB_SCRAPER_SETTINGS.trace and logger.isEnabledFor(logging.DEBUG):
+            pprint(result, max_length=20, max_depth=3)
             # logger.debug(f"Response data preview: {result.get(store_config.search_api_result_jsonpath, [])}")
 
         # Extract relevant data using JSON rules
-        cleaned = JSONExtractor(store_config.search_api_result_jsonrules).extract(result)
+        cleaned = store_config.json_extractor.extract(result)
 
         # Log the number of items received
         items_size = len(cleaned)
@@ -72,6 +77,6 @@ class ApiResquetClient:
         return {
             "data": cleaned,
             "data_from": "Coles RapidAPI",
-            "data_size": len(str(cleaned)),
+            "data_size": len(orjson.dumps(cleaned)),
             "data_format": "json"
         }
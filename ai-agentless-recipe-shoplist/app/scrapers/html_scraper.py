@@ -1,6 +1,9 @@
+import asyncio
 import logging
 import traceback
-from functools import partial
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Callable
 
 from app.config.logging_config import get_logger, log_function_call
 from app.config.store_config import StoreConfig
@@ -14,6 +17,11 @@ from .html_content_extractor import (
 
 logger = get_logger(__name__)
 
+@lru_cache(maxsize=32)
+def _get_selectors_processor(selectors: tuple[tuple[str, str], ...]) -> Callable[[str], dict]:
+    """Build the selectors processor once per (static) store selectors."""
+    return partial(process_html_content_with_selectors, selectors=dict(selectors))
+
 class HTMLScraper:
     """Service for processing data with caching and error handling."""
     
@@ -26,13 +34,47 @@ class HTMLScraper:
         # Initialize web fetcher
         self.web_fetcher = get_web_fetcher()
 
+        # Background storage saves still in flight, and the latest one per URL
+        self._pending_saves: set[asyncio.Task] = set()
+        self._latest_save: dict[str, asyncio.Task] = {}
+
+    async def _safe_save(self, url: str, data, previous: asyncio.Task = None, **kwargs) -> None:
+        """Save fetched content after any earlier save for the URL, logging instead of raising on failure."""
+        if previous is not None:
+            # Saves for one URL share a storage key, so they must not interleave
+            await asyncio.wait([previous])
+        try:
+            await self.content_storage.save_fetch(url, data, **kwargs)
+        except Exception as e:
+            logger.error(f"{self.name}: Failed to save content for {url}: {e}")
+
+    def _save_done(self, url: str, task: asyncio.Task) -> None:
+        """Forget a finished background save."""
+        self._pending_saves.discard(task)
+        if self._latest_save.get(url) is task:
+            del self._latest_save[url]
+
+    def _save_in_background(self, url: str, data, **kwargs) -> None:
+        """Save fetched content without blocking the scrape pipeline, in call order per URL."""
+        previous = self._latest_save.get(url)
+        task = asyncio.create_task(self._safe_save(url, data, previous=previous, **kwargs))
+        self._pending_saves.add(task)
+        self._latest_save[url] = task
+        task.add_done_callback(partial(self._save_done, url))
+
+    async def flush(self) -> None:
+        """Wait for all background saves to finish."""
+        if self._pending_saves:
+            await asyncio.gather(*self._pending_saves, return_exceptions=True)
+
     async def _fetch(self, url: str, data_format: str ) -> dict:
         """Fetch content from cache, disk, or web (in that order)."""
 
-        log_function_call("HTMLScraper._fetch", {
-            "url": url,
-            "data_format": data_format
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("HTMLScraper._fetch", {
+                "url": url,
+                "data_format": data_format
+            })
 
         # Try loading from cache or disk storage
         loaded_data = await self.content_storage.load_fetch(url)
@@ -46,12 +88,12 @@ class HTMLScraper:
 
         # Debug: print keys if data is dict
         if logger.isEnabledFor(logging.DEBUG) and isinstance(web_data, dict):
-            logger.debug(f"{self.name}: Web data keys: {list(web_data.keys())}")
-            logger.debug(f"{self.name}: Web data preview: {web_data.get('data', '')[:200]}")
+            logger.debug("%s: Web data keys: %s", self.name, ", ".join(islice(web_data, 10)))
+            logger.debug("%s: Web data preview: %.200s", self.name, web_data.get("data", ""))
 
         if "data" in web_data:
             raw_data = web_data.get("data")
-            await self.content_storage.save_fetch(url, raw_data, format=data_format)
+            self._save_in_background(url, raw_data, format=data_format)
 
         web_data["data_format"] = data_format
         return web_data
@@ -68,7 +110,7 @@ class HTMLScraper:
 
         # Save processed data to cache and disk
         if processed_data:
-            await self.content_storage.save_fetch(url, processed_data.get("data"), format=processed_data.get("data_processed_format"))
+            self._save_in_background(url, processed_data.get("data"), format=processed_data.get("data_processed_format"))
 
         processed_data["data_processed"] = True
         return processed_data
@@ -76,15 +118,16 @@ class HTMLScraper:
     def _get_html_processor(self, html_selectors: dict[str, str] = None, data_format: str = "html") -> callable:
         """Get the appropriate HTML processor function."""
         if html_selectors and data_format == "html":
-            return partial(process_html_content_with_selectors, selectors=html_selectors)
+            return _get_selectors_processor(tuple(html_selectors.items()))
         return process_html_content
 
     async def fetch_and_process(self, url: str, html_selectors: dict[str, str] = None, data_format: str ="html") -> dict:
         """Fetch and process web data with caching."""
-        log_function_call("WebDataService.fetch_and_process", {
-            "url": url,
-            "data_format": data_format
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("WebDataService.fetch_and_process", {
+                "url": url,
+                "data_format": data_format
+            })
         try:
             # Check if processed data is already available    
             loaded_processed_data = await self.content_storage.load_fetch(key=url, alias="processed")
@@ -1,8 +1,9 @@
-from typing import Protocol
+from functools import lru_cache
+from typing import Callable, Protocol
 
 from app.config.store_config import StoreConfig
 from app.scrapers.api_request_client import ApiResquetClient
-from app.scrapers.html_scraper import HTMLScraper
+from app.scrapers.html_scraper import get_html_scraper
 
 
 class ScraperProtocol(Protocol):
@@ -15,11 +16,23 @@ class ScraperFactory:
 
     @staticmethod
     def create_scraper(store_config: StoreConfig) -> ScraperProtocol:
-        if store_config.search_type == "html":
-            return HTMLScraper()
-        elif store_config.search_type == "coles_rapidapi":
-            return ApiResquetClient(store_config.name)
-        elif store_config.search_type == "Aldi_api":
-            return ApiResquetClient(store_config.name)
-        else:
-            raise ValueError(f"Unknown scraper type: {store_config.search_type}")
\ No newline at end of file
+        """Return the shared scraper for the store's search type."""
+        try:
+            builder = _SCRAPER_BUILDERS[store_config.search_type]
+        except KeyError:
+            raise ValueError(f"Unknown scraper type: {store_config.search_type}") from None
+        return builder(store_config)
+
+
+@lru_cache(maxsize=None)
+def _api_client(name: str) -> ApiResquetClient:
+    """Create the API client once per store name."""
+    return ApiResquetClient(name)
+
+
+# Scraper builder per store search type
+_SCRAPER_BUILDERS: dict[str, Callable[[StoreConfig], ScraperProtocol]] = {
+    "html": lambda store_config: get_html_scraper(),
+    "coles_rapidapi": lambda store_config: _api_client(store_config.name),
+    "Aldi_api": lambda store_config: _api_client(store_config.name),
+}
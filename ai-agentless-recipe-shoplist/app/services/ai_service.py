@@ -1,9 +1,12 @@
 """AI service for intelligent web crawling and grocery search optimization."""
 
+import asyncio
 import logging
 import traceback
+from typing import Any, Optional, TypeVar
 
 import rich
+from pydantic import BaseModel
 
 from app.client.ai_chat_client import get_chat_client
 from app.scrapers.html_scraper import get_html_scraper
@@ -11,11 +14,30 @@ from app.scrapers.scraper_factory import ScraperFactory
 
 from ..config.logging_config import get_logger
 from ..config.store_config import StoreConfig
-from ..models import ChatCompletionResult, Ingredient, Product, Recipe, ShoppingListItem
+from ..models import (
+    BatchShoppingListResult,
+    ChatCompletionResult,
+    Ingredient,
+    Product,
+    Recipe,
+    ShoppingListItem,
+)
 
 # Get module logger
 logger = get_logger(__name__)
 
+M = TypeVar("M", bound=BaseModel)
+
+# Maximum number of store searches in flight across all requests
+MAX_CONCURRENT_SCRAPES = 16
+
+def _as_model(model_class: type[M], content: Any) -> M:
+    """Return AI response content as a model, validating only raw (non-model) content."""
+    # Structured outputs are already parsed and validated by the provider SDK
+    if isinstance(content, model_class):
+        return content
+    return model_class.model_validate(content)
+
 class AIService:
     """AI Service for intelligent recipe extraction and grocery product search."""
     
@@ -23,6 +45,8 @@ class AIService:
         self.name = "AIService"
         self.web_scraper = get_html_scraper()
         self.ai_chat_client = get_chat_client()
+        self._scrape_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+        self._store_semaphores: dict[str, asyncio.Semaphore] = {}
     
     async def extract_recipe_intelligently(self, url: str) -> dict:
         """Extract recipe data using AI intelligence."""
@@ -45,7 +69,7 @@ class AIService:
             ia_response: ChatCompletionResult[Recipe] = await self.ai_chat_client.extract_recipe_data(fetch_data_processed)
 
             # Parse AI response into Recipe model
-            recipe = ia_response.content if isinstance(ia_response.content, Recipe) else Recipe(**ia_response.content)
+            recipe = _as_model(Recipe, ia_response.content)
 
             return {
                 "recipe": recipe,
@@ -68,6 +92,13 @@ class AIService:
                 "message": f"Failed in extracting recipe",
             }
 
+    def _store_semaphore(self, store: StoreConfig) -> asyncio.Semaphore:
+        """Get the semaphore bounding in-flight searches against a store."""
+        semaphore = self._store_semaphores.get(store.name)
+        if semaphore is None:
+            semaphore = self._store_semaphores[store.name] = asyncio.Semaphore(store.request_max_concurrency)
+        return semaphore
+
     async def _scrape_grocery_product(self, ingredient: Ingredient, store: StoreConfig) -> dict:
         """Scrape grocery product for an ingredient from a specific store."""
         # Fetch search page content
@@ -79,7 +110,8 @@ class AIService:
 
         # Use web scraper to fetch and process content
         scraper = ScraperFactory.create_scraper(store)
-        fetch_result = await scraper.query_products(ingredient.name, store)
+        async with self._store_semaphore(store), self._scrape_semaphore:
+            fetch_result = await scraper.query_products(ingredient.name, store)
 
         if "data" not in fetch_result:
             raise ValueError("No data found in fetched result for ingredient extraction")
@@ -92,45 +124,39 @@ class AIService:
 
         return results
 
-    async def search_grocery_products_intelligently(self, ingredient: Ingredient, stores: list[StoreConfig] = []) -> dict:
-        """Search grocery stores for deals on ingredients using AI."""
-        logger.info(f"[{self.name}] Searching {ingredient.name} in {stores} stores using AI")
-
+    async def _search_one_store(self, ingredient: Ingredient, store: StoreConfig) -> Optional[Product]:
+        """Scrape a store for an ingredient and pick the best match product using AI."""
         try:
             # Fetch the products search results
-            store_fetch_results = {}
-
-            # Iterate over stores to fetch search results
-            for store in stores:
-                try:
-                    # Save fetch results per store
-                    store_fetch_results[store.store_id] = await self._scrape_grocery_product(ingredient, store)
-                except Exception as e:
-                    logger.error(f"[{self.name}] Error searching products in store {store.name}: {e}")
-                    continue
+            store_fetch_results = await self._scrape_grocery_product(ingredient, store)
+        except Exception as e:
+            logger.error(f"[{self.name}] Error searching products in store {store.name}: {e}")
+            return None
 
-            # # Search for best match products using AI provider
-            # fetch_data_processed = []
-            # for fetch in store_fetch_results.values():
-            #     if fetch.get("data"):
-            #         fetch_data_processed.extend(fetch.get("data"))
+        try:
+            # Use AI to find the best match products
+            ia_response_best_product: ChatCompletionResult[Product] = await self.ai_chat_client.search_best_match_products(ingredient, store_fetch_results)
+            return _as_model(Product, ia_response_best_product.content)
+        except Exception as e:
+            logger.error(f"[{self.name}] Error awaiting fetch for store {store.store_id}: {e}")
+            return None
 
+    async def search_grocery_products_intelligently(self, ingredient: Ingredient, stores: list[StoreConfig] = []) -> dict:
+        """Search grocery stores for deals on ingredients using AI."""
+        logger.info(f"[{self.name}] Searching {ingredient.name} in {stores} stores using AI")
 
-            # Iterate over store fetch results to get best match products
-            best_product_per_store = {}
-            for store_id, store_fetch_results in store_fetch_results.items():
-                try:
-                     # Use AI to find the best match products
-                    ia_response_best_product: ChatCompletionResult[Product] = await self.ai_chat_client.search_best_match_products(ingredient, store_fetch_results)
-                    product = ia_response_best_product.content if isinstance(ia_response_best_product.content, Product) else Product(**ia_response_best_product.content)
-                    best_product_per_store[store_id] = product
-                except Exception as e:
-                    logger.error(f"[{self.name}] Error awaiting fetch for store {store_id}: {e}")
+        try:
+            # Search all stores concurrently, so the wall time is the slowest store instead of the sum
+            products = await asyncio.gather(*(self._search_one_store(ingredient, store) for store in stores))
+            best_product_per_store = {
+                store.store_id: product
+                for store, product in zip(stores, products)
+                if product is not None
+            }
 
             # Use AI to find the best match products
-            # If there is only one store, set the best product as the shopping item directly
             ia_response: ChatCompletionResult[ShoppingListItem] = await self.ai_chat_client.choose_best_product_in_stores(ingredient, best_product_per_store)
-            shoppingItem = ia_response.content if isinstance(ia_response.content, ShoppingListItem) else ShoppingListItem(**ia_response.content)
+            shoppingItem = _as_model(ShoppingListItem, ia_response.content)
             
             return {
                 "shoppingItem": shoppingItem,
@@ -146,6 +172,132 @@ class AIService:
                 "recipe": Recipe.default(),
                 "message": f"Failed in getting products for ingredient",
             }
+
+    async def _search_store_batch(self, ingredients: list[Ingredient], store: StoreConfig) -> Optional[tuple[dict[int, ShoppingListItem], list[dict]]]:
+        """Scrape a store for a batch of ingredients and match them all with one AI call, keyed by ingredient position."""
+        # Fetch the products search results for every ingredient in the batch concurrently
+        results = await asyncio.gather(
+            *(self._scrape_grocery_product(ingredient, store) for ingredient in ingredients),
+            return_exceptions=True
+        )
+        scraped = []
+        for index, (ingredient, result) in enumerate(zip(ingredients, results)):
+            if isinstance(result, Exception):
+                logger.error(f"[{self.name}] Error searching {ingredient.name} in store {store.name}: {result}")
+                continue
+            scraped.append((index, ingredient, result))
+
+        if not scraped:
+            return None
+
+        # Only ingredients with store results are sent to the AI
+        scraped_ingredients = [ingredient for _, ingredient, _ in scraped]
+        store_fetch_results = {ingredient.name: result for _, ingredient, result in scraped}
+
+        try:
+            # Use AI to find the best match products for the whole batch
+            ia_response: ChatCompletionResult[BatchShoppingListResult] = await self.ai_chat_client.search_best_match_products_batch(scraped_ingredients, store_fetch_results)
+            batch = _as_model(BatchShoppingListResult, ia_response.content)
+        except Exception as e:
+            logger.error(f"[{self.name}] Error matching batch products for store {store.store_id}: {e}")
+            return None
+
+        ai_stats = [{**(ia_response.metadata or {})}]
+
+        # Items are returned in the order of the ingredients sent
+        if len(batch.items) == len(scraped):
+            return {index: item for (index, _, _), item in zip(scraped, batch.items)}, ai_stats
+
+        logger.warning(f"[{self.name}] Batch match for store {store.store_id} returned {len(batch.items)} items for {len(scraped)} ingredients, matching one by one")
+        items, one_by_one_stats = await self._match_store_one_by_one(scraped, store)
+        return items, ai_stats + one_by_one_stats
+
+    async def _match_store_one_by_one(self, scraped: list[tuple[int, Ingredient, Any]], store: StoreConfig) -> tuple[dict[int, ShoppingListItem], list[dict]]:
+        """Match each scraped ingredient with its own AI call, keyed by ingredient position."""
+        responses = await asyncio.gather(
+            *(self.ai_chat_client.search_best_match_products(ingredient, result) for _, ingredient, result in scraped),
+            return_exceptions=True
+        )
+
+        items = {}
+        ai_stats = []
+        for (index, ingredient, _), response in zip(scraped, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                product = _as_model(Product, response.content)
+            except Exception as e:
+                logger.error(f"[{self.name}] Error matching {ingredient.name} in store {store.store_id}: {e}")
+                continue
+            items[index] = ShoppingListItem(
+                ingredient=ingredient,
+                selected_product=product,
+                quantity=product.quantity,
+                total_cost=product.price * product.quantity
+            )
+            ai_stats.append({**(response.metadata or {})})
+        return items, ai_stats
+
+    async def _choose_best_item(self, ingredient: Ingredient, store_items: dict[str, ShoppingListItem]) -> tuple[ShoppingListItem, Optional[dict]]:
+        """Pick the shopping item for an ingredient from the per-store matches."""
+        # If there is only one store, set the best product as the shopping item directly
+        if len(store_items) == 1:
+            return next(iter(store_items.values())), None
+
+        # Use AI to choose the best product across stores
+        store_candidates = {store_id: item.selected_product for store_id, item in store_items.items()}
+        ia_response: ChatCompletionResult[ShoppingListItem] = await self.ai_chat_client.choose_best_product_in_stores(ingredient, store_candidates)
+        shoppingItem = _as_model(ShoppingListItem, ia_response.content)
+        return shoppingItem, {**(ia_response.metadata or {})}
+
+    async def search_grocery_products_batch(self, ingredients: list[Ingredient], stores: list[StoreConfig] = []) -> dict:
+        """Search grocery stores for a batch of ingredients using one AI call per store."""
+        logger.info(f"[{self.name}] Searching {len(ingredients)} ingredients in {stores} stores using AI")
+
+        try:
+            ai_stats = []
+
+            # Search all stores concurrently; best shopping item per store, keyed by ingredient position
+            store_results = await asyncio.gather(*(self._search_store_batch(ingredients, store) for store in stores))
+            best_items_per_store: dict[str, dict[int, ShoppingListItem]] = {}
+            for store, result in zip(stores, store_results):
+                if result is None:
+                    continue
+                best_items_per_store[store.store_id], metadata = result
+                ai_stats.extend(metadata)
+
+            matched_ingredients = []
+            for index, ingredient in enumerate(ingredients):
+                store_items = {
+                    store_id: items[index]
+                    for store_id, items in best_items_per_store.items()
+                    if index in items and items[index].selected_product
+                }
+                if not store_items:
+                    logger.warning(f"[{self.name}] No products matched for ingredient {ingredient.name}")
+                    continue
+                matched_ingredients.append((ingredient, store_items))
+
+            # Choose the best product across stores for every ingredient concurrently
+            chosen = await asyncio.gather(*(self._choose_best_item(ingredient, store_items) for ingredient, store_items in matched_ingredients))
+
+            shopping_items = []
+            for shoppingItem, metadata in chosen:
+                shopping_items.append(shoppingItem)
+                if metadata is not None:
+                    ai_stats.append(metadata)
+
+            return {
+                "shoppingItems": shopping_items,
+                "ai_info": ai_stats
+            }
+        except Exception as e:
+            logger.error(f"[{self.name}] Error extracting batch products: {e}")
+            logger.error(f"[{self.name}] Full stack trace: {traceback.format_exc()}")
+            return {
+                "shoppingItems": [],
+                "message": "Failed in getting products for ingredients",
+            }
     
 # Global AI service instance
 ai_service = None
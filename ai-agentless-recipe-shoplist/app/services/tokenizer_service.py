@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from typing import Optional
 
 import tiktoken
@@ -11,6 +12,13 @@ from ..config.pydantic_config import TIKTOKEN_SETTINGS
 # Get module logger
 logger = get_logger(__name__)
 
+@lru_cache(maxsize=8)
+def get_encoding(model: Optional[str] = None, encoder: str = TIKTOKEN_SETTINGS.encoder) -> tiktoken.Encoding:
+    """Get a cached tiktoken encoding for the model, or for the encoder if no model is set."""
+    if model is None:
+        return tiktoken.get_encoding(encoder)
+    return tiktoken.encoding_for_model(model)
+
 class TokenizerService:
     def __init__(self, model_name: Optional[str] = None):
         """Initialize the tokenizer service."""
@@ -20,10 +28,9 @@ class TokenizerService:
 
         if self.model is None:
             logger.debug(f"[{self.name}] Initializing tokenizer for encoder: {TIKTOKEN_SETTINGS.encoder}")
-            self.tokenizer = tiktoken.get_encoding(TIKTOKEN_SETTINGS.encoder)
         else:
             logger.debug(f"[{self.name}] Initializing tokenizer for model: {self.model}")
-            self.tokenizer = tiktoken.encoding_for_model(self.model)
+        self.tokenizer = get_encoding(self.model)
 
         logger.info(f"[{self.name}] Tokenizer initialized for model: {self.model}")
 
@@ -41,6 +48,11 @@ class TokenizerService:
     def truncate_to_token_limit(self, text: str, max_tokens: int) -> str:
         """Truncate text to fit within the specified token limit."""
 
+        # Every token covers at least one UTF-8 byte, so texts with no more bytes
+        # than the limit cannot exceed it; skip tokenization
+        if len(text) <= max_tokens and len(text.encode("utf-8")) <= max_tokens:
+            return text
+
         tokens = self.get_tokens(text)
         num_tokens = len(tokens)
 
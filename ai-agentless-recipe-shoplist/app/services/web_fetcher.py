@@ -1,7 +1,7 @@
 """Web content fetcher service for downloading recipe pages and other web content."""
 
 import time
-from typing import Any
+from typing import Any, Optional
 
 import httpx
 
@@ -17,9 +17,26 @@ class WebFetcher:
         self.name = "WebFetcher"
         self.timeout = FETCHER_SETTINGS.timeout
         self.user_agent = FETCHER_SETTINGS.user_agent
+        self._client: Optional[httpx.AsyncClient] = None
 
         logger.info(f"[{self.name}] initialized - Timeout: {self.timeout}s")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP/2 client reused across fetches."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": self.user_agent}
+            )
+        return self._client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client, shared with other scrapers to reuse connections."""
+        return self._get_client()
+
     async def fetch_url(self, url: str) -> dict[str, Any]:
         """
         Fetch content from a URL with optional caching and robust error handling.
@@ -41,33 +58,29 @@ class WebFetcher:
         start_time = time.time()
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={"User-Agent": self.user_agent}
-            ) as client:
-                logger.info(f"[{self.name}] Fetching URL: {url}")
-                response = await client.get(url)
-                response.raise_for_status()
-
-                content_length = len(response.text)
-
-                duration = time.time() - start_time
-                log_api_request("WebFetcher", url, content_length, duration, True)
-
-                logger.info(
-                    f"[{self.name}] Successfully fetched {url} - {content_length} bytes in {duration:.2f}s"
-                )
-
-                return {
-                    "url": str(response.url),
-                    "status_code": response.status_code,
-                    # "headers": dict(response.headers),
-                    "timestamp": time.time(),
-                    "data_size": content_length,
-                    "data_from": "web_fetcher",
-                    "data": response.text,
-                }
+            client = self._get_client()
+            logger.info(f"[{self.name}] Fetching URL: {url}")
+            response = await client.get(url)
+            response.raise_for_status()
+
+            content_length = len(response.text)
+
+            duration = time.time() - start_time
+            log_api_request("WebFetcher", url, content_length, duration, True)
+
+            logger.info(
+                f"[{self.name}] Successfully fetched {url} - {content_length} bytes in {duration:.2f}s"
+            )
+
+            return {
+                "url": str(response.url),
+                "status_code": response.status_code,
+                # "headers": dict(response.headers),
+                "timestamp": time.time(),
+                "data_size": content_length,
+                "data_from": "web_fetcher",
+                "data": response.text,
+            }
 
         except httpx.TimeoutException:
             self._log_fetch_error(url, start_time, "Timeout")
@@ -84,6 +97,12 @@ class WebFetcher:
         log_api_request("WebFetcher", url, 0, duration, False)
         logger.error(f"[{self.name}] {error_msg} fetching {url} after {duration:.2f}s")
 
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
     
 # Global fetcher instance
 _fetcher_instance = None
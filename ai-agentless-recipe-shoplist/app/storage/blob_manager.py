@@ -2,6 +2,9 @@
 
 import hashlib
 import json
+import logging
+import mmap
+import os
 import pickle
 import sys
 import time
@@ -22,6 +25,14 @@ logger = get_logger(__name__)
 SOURCE_ALIAS="source"
 PROCESSED_ALIAS = "processed"
 
+def _read_text_mapped(file_path: Path) -> str:
+    """Read a UTF-8 text file by decoding straight from a memory map, without a bytes copy."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, 'utf-8')
+
 class BlobManager:
     """Manages saving and loading of web content to/from disk files."""
 
@@ -241,8 +252,8 @@ class BlobManager:
         file_path = self.base_path / f"{filename}.{format}"
         
         try:
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                data = await f.read()
+            # Cached pages can be large: map the file instead of reading it into bytes first
+            data = await asyncio.to_thread(_read_text_mapped, file_path)
             
             logger.debug(f"✅ Loaded string data from: {file_path}")
             return data
@@ -386,13 +397,14 @@ class BlobManager:
         obj_size = sys.getsizeof(obj_str)
         obj_type = type(obj).__name__
 
-        log_function_call("BlobManager.save", {
-            "data_type": obj_type,
-            "alias": alias,
-            "format": format,
-            "path": str(self.base_path),
-            "data_preview": obj_str[:20] + ("..." if len(obj_str) > 20 else "")
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("BlobManager.save", {
+                "data_type": obj_type,
+                "alias": alias,
+                "format": format,
+                "path": str(self.base_path),
+                "data_preview": obj_str[:20] + ("..." if len(obj_str) > 20 else "")
+            })
 
         load_from = kwargs.get('data_from', None)
         if load_from == "local_disk":
@@ -445,12 +457,13 @@ class BlobManager:
         if not self.enabled:
             return None
 
-        log_function_call("BlobManager.load", {
-            "storage_key": key,
-            "alias": alias,
-            "format": format,
-            "path": str(self.base_path)
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("BlobManager.load", {
+                "storage_key": key,
+                "alias": alias,
+                "format": format,
+                "path": str(self.base_path)
+            })
         
         try:
             metadata = {}
@@ -1,12 +1,13 @@
 """Cache management for web content with both memory and file-based caching."""
 
 import hashlib
+import logging
 import sys
 import time
 import traceback
 from typing import Any, Optional
 
-from cachetools import TTLCache
+from cachetools import TLRUCache
 
 from ..config.logging_config import get_logger, log_function_call
 from ..config.pydantic_config import CACHE_SETTINGS
@@ -18,6 +19,10 @@ logger = get_logger(__name__)
 SOURCE_ALIAS="source"
 PROCESSED_ALIAS = "processed"
 
+def _entry_expiry(key: str, entry: dict, now: float) -> float:
+    """Expire each cache entry after its own TTL."""
+    return now + entry["ttl"]
+
 class CacheManager:
     """Manages caching for web content using (in-memory TTL cache) only."""
 
@@ -26,10 +31,11 @@ class CacheManager:
         self.enabled = CACHE_SETTINGS.enabled
         self.ttl = ttl
         self.max_size = CACHE_SETTINGS.max_size
-        self.cache = TTLCache(maxsize=self.max_size, ttl=self.ttl)
+        # One shared cache; the TTL is stored per entry so namespaces can expire at different rates
+        self.cache = TLRUCache(maxsize=self.max_size, ttu=_entry_expiry)
 
         if self.enabled:
-            logger.info(f"[{self.name}] Using TTLCache (maxsize={self.max_size}, ttl={self.ttl}s)")
+            logger.info(f"[{self.name}] Using TLRUCache (maxsize={self.max_size}, default ttl={self.ttl}s)")
         else:
             logger.warning(f"[{self.name}] Caching is disabled")
         
@@ -49,12 +55,13 @@ class CacheManager:
             obj_size = sys.getsizeof(obj_str)
             alias = alias or SOURCE_ALIAS
             
-            log_function_call("CacheManager.save", {
-                "cache_key": key,
-                "alias": alias,
-                "format": format,
-                "data_preview": obj_str[:20] + ("..." if len(obj_str) > 20 else "")
-            })
+            if logger.isEnabledFor(logging.DEBUG):
+                log_function_call("CacheManager.save", {
+                    "cache_key": key,
+                    "alias": alias,
+                    "format": format,
+                    "data_preview": obj_str[:20] + ("..." if len(obj_str) > 20 else "")
+                })
 
             load_from = kwargs.get('data_from', None)
             if load_from == "local_cache":
@@ -68,6 +75,7 @@ class CacheManager:
                 "cache_key": cache_key,
                 "alias": alias,
                 "timestamp": time.time(),
+                "ttl": kwargs.get('ttl', self.ttl),
                 "data_size": f"{obj_size} bytes ({obj_size/1024:.2f} KB)",
                 "data_format": format,
                 "data": obj
@@ -93,10 +101,11 @@ class CacheManager:
         try: 
             alias = alias or SOURCE_ALIAS
 
-            log_function_call("CacheManager.load", {
-                "cache_key": key,
-                "alias": alias
-            })
+            if logger.isEnabledFor(logging.DEBUG):
+                log_function_call("CacheManager.load", {
+                    "cache_key": key,
+                    "alias": alias
+                })
 
             cache_key = self._get_hash(key, alias)
 
@@ -1,15 +1,21 @@
-import hashlib
+import asyncio
+import atexit
+import copy
 import logging
 import os
-import sys
+import sqlite3
+import struct
+import threading
 import time
-from typing import Optional
-import pickle
+from typing import Any, Iterator, Optional
+import reprlib
 
-from unqlite import UnQLite
+import msgpack
+import xxhash
+import zstandard
+from cachetools import LRUCache
 
 from app.config.pydantic_config import DB_MANAGER_SETTINGS
-from app.utils.str_helpers import object_to_str
 
 from ..config.logging_config import get_logger, log_function_call
 
@@ -19,24 +25,175 @@ logger = get_logger(__name__)
 SOURCE_ALIAS="source"
 PROCESSED_ALIAS = "processed"
 
+# First byte of a stored entry, naming its serialization format
+MSGPACK_TAG = b"M"
+# String data (fetched HTML) is stored raw after a fixed header, with no encoding pass
+STR_TAG = b"S"
+# Compressed entries wrap a tagged entry
+ZSTD_TAG = b"Z"
+
+def _to_builtin(obj: Any) -> Any:
+    """Convert Pydantic models to plain data for msgpack."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+# Entry fields, stored positionally so the field names are not repeated in every value
+ENTRY_FIELDS = ("hash_key", "alias", "timestamp", "data_format", "data")
+
+def _entry_from_stored(stored: Any) -> dict:
+    """Rebuild an entry dict from its stored field values."""
+    if isinstance(stored, dict):
+        return stored  # Written before entries were stored positionally
+    return dict(zip(ENTRY_FIELDS, stored))
+
+# Timestamp, then byte lengths of hash key, alias and format
+_STR_HEADER = struct.Struct("<dHHH")
+
+def _str_entry_parts(entry: dict) -> tuple[bytes, ...]:
+    """Pack an entry holding string data as a header and the raw UTF-8 data."""
+    fields = [(entry[name] or "").encode() for name in ("hash_key", "alias", "data_format")]
+    header = _STR_HEADER.pack(entry["timestamp"], *map(len, fields)) + b"".join(fields)
+    return STR_TAG, header, entry["data"].encode()
+
+def _load_str_entry(body: memoryview) -> dict:
+    """Rebuild an entry packed by _str_entry_parts."""
+    timestamp, *lengths = _STR_HEADER.unpack_from(body)
+    offset = _STR_HEADER.size
+    fields = []
+    for length in lengths:
+        fields.append(str(body[offset:offset + length], "utf-8") or None)
+        offset += length
+    hash_key, alias, data_format = fields
+    return {
+        "hash_key": hash_key,
+        "alias": alias,
+        "timestamp": timestamp,
+        "data_format": data_format,
+        "data": str(body[offset:], "utf-8"),
+    }
+
+def _compress(*parts: bytes) -> bytes:
+    """Compress the parts as one zstd stream, without joining them first."""
+    compressor = zstandard.ZstdCompressor(level=3).compressobj()
+    return b"".join([ZSTD_TAG, *(compressor.compress(part) for part in parts), compressor.flush()])
+
+def _dump_entry(entry: dict) -> bytes:
+    """Serialize a database entry with msgpack, compressing large entries."""
+    if isinstance(entry["data"], str):
+        parts = _str_entry_parts(entry)
+    else:
+        values = [entry[name] for name in ENTRY_FIELDS]
+        parts = MSGPACK_TAG, msgpack.packb(values, default=_to_builtin, use_bin_type=True)
+    # Large payloads are compressed straight from the serializer output, never copied whole
+    size = sum(map(len, parts))
+    if size > DB_MANAGER_SETTINGS.compress_threshold:
+        compressed = _compress(*parts)
+        logger.debug(f"Compressed db entry from {size} to {len(compressed)} bytes")
+        return compressed
+    return b"".join(parts)
+
+def _load_entry(entry_bytes: bytes) -> dict:
+    """Deserialize a database entry."""
+    tag = entry_bytes[:1]
+    # View past the tag instead of slicing a copy of the payload
+    body = memoryview(entry_bytes)[1:]
+    if tag == ZSTD_TAG:
+        return _load_entry(zstandard.ZstdDecompressor().decompressobj().decompress(body))
+    if tag == STR_TAG:
+        return _load_str_entry(body)
+    if tag == MSGPACK_TAG:
+        return _entry_from_stored(msgpack.unpackb(body, raw=False))
+    raise ValueError(f"Unknown database entry format: {tag!r}")
+
+# WAL lets loads read while a batch commits; NORMAL sync is durable enough for a cache
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    # Truncate the WAL back to 64 MB after checkpoints so long crawls don't grow it unbounded
+    "PRAGMA journal_size_limit=67108864",
+)
+
+# Statements are module constants so sqlite3 reuses their prepared form
+CREATE_TABLE_SQL = "CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v BLOB) WITHOUT ROWID"
+SELECT_KEYS_SQL = "SELECT k FROM kv"
+SELECT_VALUE_SQL = "SELECT v FROM kv WHERE k = ?"
+UPSERT_SQL = "INSERT OR REPLACE INTO kv (k, v) VALUES (?, ?)"
+DELETE_SQL = "DELETE FROM kv WHERE k = ?"
+
 class DBManager:
     def __init__(self, db_path: str = DB_MANAGER_SETTINGS.path):
         self.name = "DBManager"
-        self.db = UnQLite(db_path)
         self.enabled = DB_MANAGER_SETTINGS.enabled
 
-        # Create directory if it doesn't exist
-        db_dir = os.path.dirname(db_path)
-        os.makedirs(db_dir, exist_ok=True)
+        # Writes buffered until the next group commit
+        self._batch_size = max(1, DB_MANAGER_SETTINGS.batch_size)
+        self._pending: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+        # Saves queued for the background writer, created on first use inside the event loop
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+        # Decoded entries of recent loads, keyed by hash key
+        self._mem_cache = LRUCache(maxsize=max(1, DB_MANAGER_SETTINGS.memory_cache_size))
+
+        # Connection opened on first use, so a disabled database never touches disk
+        self.db_path = db_path
+        self._db: Optional[sqlite3.Connection] = None
+        self._open_lock = threading.Lock()
+
+        # Stored and pending keys, so lookups of missing keys skip the database
+        self._keys: set[str] = set()
 
         if self.enabled:
             logger.info(f"[{self.name}] Using database at: {db_path}")
         else:
             logger.warning(f"[{self.name}] Database is disabled")
 
+    @property
+    def db(self) -> sqlite3.Connection:
+        """SQLite connection, opened on first use."""
+        if self._db is None:
+            self._open()
+        return self._db
+
+    def _open(self) -> None:
+        """Create the database file and load its keys."""
+        with self._open_lock:
+            if self._db is not None:
+                return
+
+            # Create directory if it doesn't exist
+            db_dir = os.path.dirname(self.db_path)
+            os.makedirs(db_dir, exist_ok=True)
+
+            # Autocommit connection; batches open their own transactions
+            db = sqlite3.connect(
+                self.db_path,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=DB_MANAGER_SETTINGS.statement_cache_size,
+            )
+            for pragma in SQLITE_PRAGMAS:
+                db.execute(pragma)
+            db.execute(CREATE_TABLE_SQL)
+
+            self._keys.update(key for (key,) in db.execute(SELECT_KEYS_SQL))
+            self._db = db
+
+    def _iter_keys(self) -> Iterator[str]:
+        """Iterate over the committed keys, without reading values."""
+        for (key,) in self.db.execute(SELECT_KEYS_SQL):
+            yield key
+
     def _get_hash(self, key: str, alias: str) -> str:
         """Generate a hash for the key and alias to use as key."""
-        return hashlib.md5(f"{alias}_{key}".encode()).hexdigest()
+        return xxhash.xxh3_128_hexdigest(f"{alias}_{key}".encode())
 
     def save(self, key: str, obj: any, alias: str = None, format: str = "json", **kwargs) -> None:
         """Save an object in the database under the given key."""
@@ -45,17 +202,6 @@ class DBManager:
             return None
 
         try: 
-            obj_str = object_to_str(obj)
-            obj_size = sys.getsizeof(obj_str)
-
-            log_function_call("DBManager.save", {
-                    "cache_key": key,
-                    "alias": alias,
-                    "format": format,
-                    "data_size": f"{obj_size} bytes ({obj_size/1024:.2f} KB)",
-                    "data_preview": obj_str[:20] + ("..." if len(obj_str) > 20 else "")
-                })
-            
             load_from = kwargs.get('data_from', None)
             if load_from == "local_db":
                 logger.debug(f"[{self.name}] Skipping save since data loaded from local db")
@@ -66,19 +212,85 @@ class DBManager:
                     "hash_key": hash_key,
                     "alias": alias,
                     "timestamp": time.time(),
-                    "data_size": f"{obj_size} bytes ({obj_size/1024:.2f} KB)",
                     "data_format": format,
                     "data": obj
                 }
 
-            self.db[hash_key] = pickle.dumps(db_entry)
-
-            self.db.commit()
+            entry_bytes = _dump_entry(db_entry)
+            if logger.isEnabledFor(logging.DEBUG):
+                # Reuse the serialized entry instead of stringifying the object again
+                entry_size = len(entry_bytes)
+                log_function_call("DBManager.save", {
+                        "cache_key": key,
+                        "alias": alias,
+                        "format": format,
+                        "data_size": f"{entry_size} bytes ({entry_size/1024:.2f} KB)",
+                        "data_preview": reprlib.repr(obj)
+                    })
+            with self._lock:
+                self._mem_cache.pop(hash_key, None)
+                self._pending[hash_key] = entry_bytes
+                self._keys.add(hash_key)
+                if len(self._pending) >= self._batch_size:
+                    self._commit_pending()
             logger.debug(f"[{self.name}] Saved obj to db for {hash_key} and alias '{alias}'")
         except Exception as e:
             logger.error(f"[{self.name}] Error saving to database: {e}")
             return None
 
+    def _commit_pending(self) -> None:
+        """Write all buffered entries in a single transaction. Caller holds the lock."""
+        if not self._pending:
+            return
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            self.db.executemany(UPSERT_SQL, self._pending.items())
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+        logger.debug(f"[{self.name}] Committed {len(self._pending)} entries to db")
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Commit any buffered writes to the database."""
+        try:
+            with self._lock:
+                self._commit_pending()
+        except Exception as e:
+            logger.error(f"[{self.name}] Error flushing database writes: {e}")
+
+    def save_in_background(self, key: str, obj: any, **kwargs) -> None:
+        """Queue a save for the background writer, dropping the oldest queued save when full."""
+        if not self.enabled:
+            return None
+
+        if self._writer_task is None or self._writer_task.get_loop() is not asyncio.get_running_loop():
+            self._write_queue = asyncio.Queue(maxsize=max(1, DB_MANAGER_SETTINGS.write_queue_size))
+            self._writer_task = asyncio.create_task(self._run_writer())
+
+        if self._write_queue.full():
+            dropped_key, _, _ = self._write_queue.get_nowait()
+            self._write_queue.task_done()
+            logger.warning(f"[{self.name}] Write queue full, dropped queued save for {dropped_key}")
+
+        self._write_queue.put_nowait((key, obj, kwargs))
+
+    async def _run_writer(self) -> None:
+        """Drain queued saves, running each blocking save in a worker thread."""
+        while True:
+            key, obj, kwargs = await self._write_queue.get()
+            try:
+                await asyncio.to_thread(self.save, key, obj, **kwargs)
+            finally:
+                self._write_queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait for queued saves to be written, then commit them."""
+        if self._write_queue is not None:
+            await self._write_queue.join()
+        await asyncio.to_thread(self.flush)
+
     def load(self, key: str, alias: str = None) -> Optional[dict]:
         """Retrieve an object from the database by key."""
 
@@ -88,12 +300,30 @@ class DBManager:
         try:
             hash_key = self._get_hash(key, alias or SOURCE_ALIAS)
 
-            if self.exists(hash_key) is False:
-                logger.debug(f"[{self.name}] DB miss for key: {hash_key} (alias='{alias}')")
-                return None
+            with self._lock:
+                cached_entry = self._mem_cache.get(hash_key)
 
-            obj_bytes = self.db[hash_key]
-            obj_dict = pickle.loads(obj_bytes)
+            if cached_entry is None:
+                if self.exists(hash_key) is False:
+                    logger.debug(f"[{self.name}] DB miss for key: {hash_key} (alias='{alias}')")
+                    return None
+
+                with self._lock:
+                    obj_bytes = self._pending.get(hash_key)
+                    if obj_bytes is None:
+                        row = self.db.execute(SELECT_VALUE_SQL, (hash_key,)).fetchone()
+                        if row is None:
+                            raise KeyError(hash_key)
+                        obj_bytes = row[0]
+                cached_entry = _load_entry(obj_bytes)
+                # Size of the stored entry, known only once it is serialized
+                entry_size = len(obj_bytes)
+                cached_entry.setdefault("data_size", f"{entry_size} bytes ({entry_size/1024:.2f} KB)")
+                with self._lock:
+                    self._mem_cache[hash_key] = cached_entry
+
+            # Copy so callers cannot mutate the cached entry
+            obj_dict = copy.copy(cached_entry)
             obj_dict["data_from"] = "local_db"
 
             if logger.isEnabledFor(logging.DEBUG):
@@ -107,33 +337,54 @@ class DBManager:
         
     def delete(self, key: str) -> bool:
         """Delete an object from the database by key."""
-        if key in self.db:
-            del self.db[key]
-            return True
-        return False
+        if not self.enabled:
+            return False
+        if self._db is None:
+            self._open()
+        with self._lock:
+            self._mem_cache.pop(key, None)
+            self._pending.pop(key, None)
+            if key not in self._keys:
+                return False
+            self._keys.discard(key)
+            self.db.execute(DELETE_SQL, (key,))
+        return True
 
     def exists(self, key: str) -> bool:
         """Check if an object exists in the database by key."""
-        return key in self.db
+        if not self.enabled:
+            return False
+        if self._db is None:
+            self._open()
+        return key in self._keys
     
-    def all_keys(self) -> list[str]:
-        """Get all keys in the specified collection."""
-        return list(self.db.keys())
+    def all_keys(self) -> Iterator[str]:
+        """Iterate over all keys in the database."""
+        if not self.enabled:
+            return iter(())
+        self.flush()
+        return self._iter_keys()
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Called when exiting the 'with' block.
-        Ensures the database is properly closed.
+        Ensures buffered writes are committed and the database is properly closed.
         """
-        if self.db:
-            self.db.close()
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
     
 # Global cache instance
 _db_instance = None
+_db_instance_lock = threading.Lock()
 
 def get_db_manager() -> DBManager:
     """Get or create the global cache manager instance."""
     global _db_instance
     if _db_instance is None:
-        _db_instance = DBManager()
-    return _db_instance
\ No newline at end of file
+        # Double-checked so concurrent first calls from worker threads create a single instance
+        with _db_instance_lock:
+            if _db_instance is None:
+                _db_instance = DBManager()
+    return _db_instance
@@ -1,5 +1,9 @@
 """Persistent storage layer for AI Recipe Shoplist Crawler."""
 
+import asyncio
+import logging
+import reprlib
+import threading
 from pathlib import Path
 import traceback
 from typing import Any, Optional
@@ -18,14 +22,48 @@ from ..config.pydantic_config import (
 
 logger = get_logger(__name__)
 
+def _preview(data: Any, length: int) -> str:
+    """Short preview of stored data, without stringifying large payloads."""
+    if isinstance(data, str):
+        return data[:length] + ("..." if len(data) > length else "")
+    preview = reprlib.Repr()
+    preview.maxother = preview.maxstring = length
+    return preview.repr(data)
+
+class AIResponseLease:
+    """Reservation for an AI response that is being requested by one caller."""
+
+    def __init__(self, storage: "StorageManager", key: str, alias: str):
+        self.storage = storage
+        self.key = key
+        self.alias = alias
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    async def complete(self, data: ChatCompletionResult, **kwargs) -> None:
+        """Save the response and hand it to callers waiting on the same key."""
+        try:
+            await self.storage.save_ai_response(key=self.key, data=data, alias=self.alias, **kwargs)
+        finally:
+            self._resolve(data)
+
+    def release(self) -> None:
+        """Release the reservation without a response (e.g. the request failed)."""
+        self._resolve(None)
+
+    def _resolve(self, data: Optional[ChatCompletionResult]) -> None:
+        if not self.future.done():
+            self.future.set_result(data)
+        if self.storage._ai_leases.get((self.alias, self.key)) is self:
+            del self.storage._ai_leases[(self.alias, self.key)]
+
 class StorageManager:
     """Manager for persistent storage of data."""
 
     def __init__(self, storage_path: Optional[Path] = None):
         self.name = "StorageManager"
 
+        # AI responses share the cache, namespaced by alias and expiring after their own TTL
         self.cache_manager = get_cache_manager()
-        self.ai_cache_manager = get_cache_manager(ttl=CACHE_SETTINGS.ai_ttl)
 
         self.db_manager = get_db_manager()
 
@@ -34,6 +72,8 @@ class StorageManager:
 
         self.storage_api_path = BlobManager(BLOB_SETTINGS.base_path / "api_cache")
 
+        # In-flight AI requests, keyed by (alias, key)
+        self._ai_leases: dict[tuple[str, str], AIResponseLease] = {}
 
     async def save_fetch(self, key: str, data: Any, **kwargs) -> None:
         """Save fetched content to cache and blob storage."""
@@ -41,16 +81,18 @@ class StorageManager:
         alias = kwargs.get('alias', "html")
         format = kwargs.get('format', "html")
 
-        log_function_call("StorageManager.save_fetch", {
-            "storage_key": key,
-            "alias": alias,
-            "format": format,
-            "content_preview": str(data)[:20] + ("..." if len(data) > 20 else "")
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("StorageManager.save_fetch", {
+                "storage_key": key,
+                "alias": alias,
+                "format": format,
+                "content_preview": _preview(data, 20)
+            })
 
         if data:
             self.cache_manager.save(key, data, format=format, alias=alias)
-            self.db_manager.save(key, data, format=format, alias=alias)
+            # Persisted to the database off the request path
+            self.db_manager.save_in_background(key, data, format=format, alias=alias)
             await self.blob_storage.save(key, data, format=format, alias=alias)
 
     async def load_fetch(self, key: str, **kwargs) -> str:
@@ -59,14 +101,12 @@ class StorageManager:
         alias = kwargs.get('alias', None)
         format = kwargs.get('format', None)
 
-        log_function_call("StorageManager.load_fetch", {
-            "storage_key": key,
-            "alias": alias,
-            "format": format
-        })
-
-        alias = kwargs.get('alias', None)
-        format = kwargs.get('format', None)
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("StorageManager.load_fetch", {
+                "storage_key": key,
+                "alias": alias,
+                "format": format
+            })
 
         # Try loading from cache
         cached_data = self.cache_manager.load(key=key, alias=alias)
@@ -95,16 +135,18 @@ class StorageManager:
         alias = kwargs.get('alias', "json")
         format = kwargs.get('format', "json")
 
-        log_function_call("StorageManager.save_ai_response", {
-            "storage_key": key,
-            "alias": alias,
-            "format": format,
-            "data_preview": str(data)[:50] + ("..." if len(str(data)) > 50 else "")
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("StorageManager.save_ai_response", {
+                "storage_key": key,
+                "alias": alias,
+                "format": format,
+                "data_preview": _preview(data, 50)
+            })
 
         if data:
-            self.ai_cache_manager.save(key=key, obj=data, alias=alias)
-            self.db_manager.save(key=key, obj=data, alias=alias)
+            self.cache_manager.save(key=key, obj=data, alias=alias, ttl=CACHE_SETTINGS.ai_ttl)
+            # Persisted to the database off the request path
+            self.db_manager.save_in_background(key, data, alias=alias)
             await self.ai_blob_storage.save(key=key, obj=data, alias=alias, format=format)
 
     async def load_ai_response(self, key: str, **kwargs) -> dict | None:
@@ -113,14 +155,15 @@ class StorageManager:
         alias = kwargs.get('alias', None)
         model_class = kwargs.get('model_class', None)
 
-        log_function_call("StorageManager.load_ai_response", {
-            "storage_key": key,
-            "alias": alias,
-            "model_class": model_class.__name__ if model_class else None
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("StorageManager.load_ai_response", {
+                "storage_key": key,
+                "alias": alias,
+                "model_class": model_class.__name__ if model_class else None
+            })
         
         # Try cache first
-        cached_data = self.ai_cache_manager.load(key=key, alias=alias)
+        cached_data = self.cache_manager.load(key=key, alias=alias)
         if cached_data:
             logger.info(f"[{self.name}] Loaded AI response from AI cache for model_class: {model_class}")
             return self._build_chat_result(cached_data, model_class=None)  # Set None to avoid double parsing
@@ -129,7 +172,7 @@ class StorageManager:
         db_data = self.db_manager.load(key=key, alias=alias)
         if db_data:
             logger.info(f"[{self.name}] Loaded AI response from AI database for model_class: {model_class}")
-            return self._build_chat_result(db_data, model_class=None)  # Set None to avoid double parsing
+            return self._build_chat_result(db_data, model_class)
 
         # Try blob storage if cache miss
         disk_data = await self.ai_blob_storage.load(key=key, alias=alias, model_class=ChatCompletionResult)
@@ -139,27 +182,63 @@ class StorageManager:
 
         return None
 
+    async def get_or_reserve(self, key: str, **kwargs) -> tuple[Optional[ChatCompletionResult], Optional[AIResponseLease]]:
+        """
+        Load an AI response or reserve the key for the caller to produce it.
+
+        Returns (hit, None) when the response is stored or was just produced by a
+        concurrent caller for the same key, otherwise (None, lease). The lease
+        owner must call `lease.complete(response)` or `lease.release()`.
+        """
+        alias = kwargs.get('alias', None)
+        model_class = kwargs.get('model_class', None)
+
+        while True:
+            loaded_response = await self.load_ai_response(key=key, alias=alias, model_class=model_class)
+            if loaded_response:
+                return loaded_response, None
+
+            # Another caller is already requesting this response, wait for it
+            pending = self._ai_leases.get((alias, key))
+            if pending is None:
+                break
+
+            logger.info(f"[{self.name}] Waiting for in-flight AI response for {key}")
+            shared_response = await asyncio.shield(pending.future)
+            if shared_response:
+                return shared_response, None
+
+        lease = AIResponseLease(self, key, alias)
+        self._ai_leases[(alias, key)] = lease
+        return None, lease
+
     def _build_chat_result(self, data: ChatCompletionResult, model_class: type = None) -> ChatCompletionResult:
         """Build ChatCompletionResult from cached/stored data."""
 
-        log_function_call("StorageManager._build_chat_result", {
-            "data_keys": list(data.keys()),
-            "model_class": model_class.__name__ if model_class else None
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("StorageManager._build_chat_result", {
+                "data_keys": list(data.keys()),
+                "model_class": model_class.__name__ if model_class else None
+            })
 
         try:
-            logger.debug(f"[{self.name}] _build_chat_result: {data}")
+            logger.debug("[%s] _build_chat_result: %s", self.name, data)
 
-            data_from = data["data_from"]
             chat_result: ChatCompletionResult = data["data"]
+            metadata = {"data_from": data["data_from"]}
+            if isinstance(chat_result, dict):
+                chat_result = ChatCompletionResult.model_validate(chat_result)
             
             content = chat_result.content
-            if model_class:
+            if model_class and isinstance(content, dict):
                 content = model_class(**content)
+            elif chat_result.metadata == metadata:
+                # Nothing to update, skip the copy
+                return chat_result
                 
             return chat_result.model_copy(update={
                 "content": content,
-                "metadata": {"data_from": data_from}
+                "metadata": metadata
             })
         except Exception as e:
             logger.error(f"[{self.name}] Error building chat result: {e}")
@@ -171,12 +250,13 @@ class StorageManager:
         alias = kwargs.get('alias', "json")
         format = kwargs.get('format', "json")
 
-        log_function_call("StorageManager.store_api_response", {
-            "storage_key": key,
-            "alias": alias,
-            "format": format,
-            "data_preview": str(data)[:50] + ("..." if len(str(data)) > 50 else "")
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("StorageManager.store_api_response", {
+                "storage_key": key,
+                "alias": alias,
+                "format": format,
+                "data_preview": _preview(data, 50)
+            })
 
         if data:
             self.cache_manager.save(key, data, format=format, alias=alias)
@@ -184,16 +264,22 @@ class StorageManager:
 
     def clear_storage(self) -> None:
         """Clear all data from cache and blob storage."""
-        log_function_call("StorageManager.clear_storage", {})
+        if logger.isEnabledFor(logging.DEBUG):
+            log_function_call("StorageManager.clear_storage", {})
+        self.db_manager.flush()
         self.cache_manager.clear()
         self.blob_storage.clear()
 
  # Global storage instance
 _storage_instance = None
+_storage_instance_lock = threading.Lock()
 
 def get_storage_manager() -> StorageManager:
     """Get or create the global content storage instance."""
     global _storage_instance
     if _storage_instance is None:
-        _storage_instance = StorageManager()
-    return _storage_instance
\ No newline at end of file
+        # Double-checked so concurrent first calls from worker threads create a single instance
+        with _storage_instance_lock:
+            if _storage_instance is None:
+                _storage_instance = StorageManager()
+    return _storage_instance
@@ -12,9 +12,11 @@ from .retry_utils import (
     NetworkError,
     RateLimiter,
     RateLimitError,
+    RateLimitState,
     RetryableError,
     ServerError,
     create_ai_retry_config,
+    get_rate_limit_state,
     is_retryable_error,
     retry_with_tenacity,
     with_ai_retry,
@@ -32,9 +34,11 @@ __all__ = [
     "NetworkError", 
     "RateLimitError",
     "RateLimiter",
+    "RateLimitState",
     "RetryableError",
     "ServerError",
     "create_ai_retry_config",
+    "get_rate_limit_state",
     "is_retryable_error",
     "retry_with_tenacity",
     "with_ai_retry",
@@ -0,0 +1,137 @@
+"""Adaptive concurrency limiter using additive-increase/multiplicative-decrease (AIMD)."""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from ..config.logging_config import get_logger
+from .retry_utils import NetworkError, RateLimitError, ServerError
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+
+class AIMDLimiter:
+    """
+    Concurrency limiter that adapts to the observed provider health.
+
+    The concurrency window grows by `increase` while the rolling mean latency
+    stays under `target_latency`, and is multiplied by `decrease` on rate
+    limit, server or timeout errors (like TCP congestion control).
+
+    Usage:
+        async with limiter.slot():
+            await search_ingredient(ingredient)
+
+        results = await asyncio.gather(*[limiter.run(search_ingredient, i) for i in ingredients])
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: float = 3.0,
+        min_concurrency: float = 1.0,
+        max_concurrency: float = 16.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        target_latency: float = 10.0,
+        window: int = 10
+    ):
+        """
+        Initialize the AIMD limiter.
+
+        Args:
+            initial_concurrency: Starting concurrency window
+            min_concurrency: Lower bound for the concurrency window
+            max_concurrency: Upper bound for the concurrency window
+            increase: Additive increase applied on healthy latency (alpha)
+            decrease: Multiplicative factor applied on congestion (beta)
+            target_latency: Rolling mean latency in seconds considered healthy
+            window: Number of latency samples in the rolling mean
+        """
+        self.name = "AIMDLimiter"
+        self.concurrency = initial_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.target_latency = target_latency
+
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent slots."""
+        return max(int(self.min_concurrency), int(self.concurrency))
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently in use."""
+        return self._in_flight
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def on_latency(self, latency: float) -> None:
+        """Record a successful call latency and grow the window if healthy."""
+        self._latencies.append(latency)
+        mean_latency = sum(self._latencies) / len(self._latencies)
+
+        if mean_latency <= self.target_latency:
+            self.concurrency = min(self.max_concurrency, self.concurrency + self.increase)
+
+    def on_congestion(self) -> None:
+        """Shrink the window after a rate limit, server or timeout error."""
+        # Only back off once per target latency period for a burst of failures
+        now = time.monotonic()
+        if now - self._last_decrease < self.target_latency:
+            return
+
+        self._last_decrease = now
+        self._latencies.clear()
+        self.concurrency = max(self.min_concurrency, self.concurrency * self.decrease)
+        logger.warning(f"[{self.name}] Congestion detected, concurrency reduced to {self.limit}")
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Acquire a concurrency slot for the duration of the block."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        start_time = time.monotonic()
+        try:
+            yield
+        except (RateLimitError, ServerError, NetworkError):
+            self.on_congestion()
+            raise
+        else:
+            self.on_latency(time.monotonic() - start_time)
+        finally:
+            async with condition:
+                self._in_flight -= 1
+                condition.notify_all()
+
+    async def run(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Run an async function inside a concurrency slot."""
+        async with self.slot():
+            return await func(*args, **kwargs)
+
+
+# Global limiter instance shared by the AI providers
+_aimd_limiter = None
+
+def get_aimd_limiter() -> AIMDLimiter:
+    """Get or create the global AIMD limiter instance."""
+    global _aimd_limiter
+    if _aimd_limiter is None:
+        _aimd_limiter = AIMDLimiter()
+    return _aimd_limiter
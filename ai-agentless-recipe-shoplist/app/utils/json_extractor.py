@@ -1,8 +1,78 @@
 import re
-from typing import Any, Dict, List, Optional, Union
+import threading
+from itertools import islice
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
 
 import jmespath
-from pydantic import BaseModel
+import orjson
+from pydantic import TypeAdapter
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# Instruction keys that configure a rule rather than name a sub-rule
+_RESERVED_KEYS = frozenset({"fields", "limit", "regex", "default", "filter"})
+
+# Paths that are a single plain key, looked up with dict.get instead of JMESPath
+_FIELD_PATH = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Dotted plain-key paths like "price.amount", walked key by key instead of via JMESPath
+_KEY_PATH = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)+")
+
+
+class _KeyPath(tuple):
+    """Dotted key path pre-split into its keys, searched like a compiled JMESPath expression."""
+    __slots__ = ()
+
+    def search(self, value: Any) -> Any:
+        for key in self:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+
+def _compile_path(path: str) -> Any:
+    """Compile a rule path, splitting plain dotted paths once and leaving the rest to JMESPath."""
+    if _KEY_PATH.fullmatch(path):
+        return _KeyPath(path.split("."))
+    return jmespath.compile(path)
+
+
+# Compiled regex filters shared by all extractors, keyed by pattern string
+_PATTERN_CACHE: Dict[str, re.Pattern] = {}
+_PATTERN_CACHE_LOCK = threading.Lock()
+
+
+def _get_pattern(pattern: str) -> re.Pattern:
+    """Get the compiled regex for a pattern, compiling it once per process."""
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        # Lock only on a miss; lookups of known patterns stay lock-free
+        with _PATTERN_CACHE_LOCK:
+            compiled = _PATTERN_CACHE.get(pattern)
+            if compiled is None:
+                compiled = _PATTERN_CACHE[pattern] = re.compile(pattern)
+    return compiled
+
+# Op codes of a compiled "fields" list
+OP_FIELD, OP_WILDCARD, OP_NESTED = 0, 1, 2
+
+# Marks an unset instruction option
+_MISSING = object()
+
+
+class _Instruction(NamedTuple):
+    """Dict instruction compiled once, e.g. {"fields": [...], "limit": 1, "regex": ...}."""
+    regex: Optional[re.Pattern]
+    filter: Any
+    limit: Optional[int]
+    fields: Optional[List[Any]]
+    field_ops: Optional[tuple]
+    default: Any
 
 
 class JSONExtractor:
@@ -17,7 +87,7 @@ class JSONExtractor:
     - Nested object field extraction
     - Mixed rule syntax support
     - Null value cleanup
-    - Optional Pydantic model conversion
+    - Optional Pydantic model or msgspec Struct conversion
     
     Example rules:
         {
@@ -29,29 +99,125 @@ class JSONExtractor:
         }
     """
 
-    def __init__(self, rules: Dict[str, Any], model: Optional[BaseModel] = None):
+    __slots__ = (
+        "rules", "model", "_is_struct", "_list_adapter", "_compiled",
+        "_wildcard_splits", "_compiled_sub", "_wildcard_fields",
+        "_assign_keys", "_plan", "_flat_fields", "_sub_plans",
+    )
+
+    def __init__(self, rules: Dict[str, Any], model: Optional[type] = None):
         """
         Initialize JSONExtractor with extraction rules.
         
         Args:
             rules: Dictionary describing extraction rules and patterns
-            model: Optional Pydantic model to convert output into
+            model: Optional Pydantic model or msgspec Struct to convert output into
         """
         self.rules = rules
         self.model = model
-        # Pre-compile JMESPath expressions for performance (skip special paths)
+        self._is_struct = MSGSPEC_AVAILABLE and isinstance(model, type) and issubclass(model, msgspec.Struct)
+        # Validates a whole list of extracted items in one call
+        self._list_adapter = TypeAdapter(list[model]) if model is not None and not self._is_struct else None
+        # Pre-compile path expressions for performance (skip special paths)
         self._compiled = {
-            path: jmespath.compile(path) 
+            path: _compile_path(path) 
             for path in rules.keys() 
-            if path not in [".", "@"] and not self._is_mixed_instruction(rules[path])
+            if path not in [".", "@"]
+            and not _FIELD_PATH.fullmatch(path)
+            and not self._is_mixed_instruction(rules[path])
         }
-    
+        # Pre-split wildcard paths and pre-compile their nested field paths
+        self._wildcard_splits: Dict[str, tuple] = {}
+        self._compiled_sub: Dict[str, Any] = {}
+        for path in self._compiled:
+            if "[*]." in path:
+                array_path, field_path = self._wildcard_splits[path] = tuple(path.split("[*].", 1))
+                if "." in field_path:
+                    self._compiled_sub[field_path] = _compile_path(field_path)
+        # Pre-compile regex filters and pre-split wildcard field specs, so
+        # neither is re-parsed per item
+        self._wildcard_fields: Dict[str, tuple] = {}
+        self._collect_rule_specs(rules)
+        # Output key path of every rule, e.g. "data[*].price" -> ("data", "price")
+        self._assign_keys = {path: tuple(path.replace("[*]", "").split(".")) for path in rules}
+        # Classify every rule once; extraction only runs the chosen handlers
+        self._plan = [
+            (self._rule_handler(path, instruction), path, self._compile_instruction(instruction))
+            for path, instruction in rules.items()
+        ]
+        # Rules that only copy plain top-level fields ("name": True) are
+        # extracted with a single dict comprehension per item
+        self._flat_fields = tuple(rules) if rules and all(
+            instruction is True and _FIELD_PATH.fullmatch(path)
+            for path, instruction in rules.items()
+        ) else None
+        # Same for the sub-rules of mixed instructions, keyed by parent path
+        self._sub_plans = {
+            path: self._sub_rule_plan(instruction)
+            for path, instruction in rules.items()
+            if self._is_mixed_instruction(instruction)
+        }
+
+    def _collect_rule_specs(self, rules: Any) -> None:
+        """Compile every "regex" and split every wildcard spec found in the (nested) rules."""
+        if isinstance(rules, dict):
+            pattern = rules.get("regex")
+            if isinstance(pattern, str):
+                _get_pattern(pattern)
+            for key, value in rules.items():
+                self._add_wildcard_field(key)
+                self._collect_rule_specs(value)
+        elif isinstance(rules, list):
+            for value in rules:
+                if isinstance(value, str):
+                    self._add_wildcard_field(value)
+                else:
+                    self._collect_rule_specs(value)
+
+    def _add_wildcard_field(self, spec: str) -> None:
+        """Split a wildcard spec like "categories[*].name" into (array, field, output name)."""
+        if "[*]." not in spec:
+            return
+        array_field, target_field = spec.split("[*].", 1)
+        clean_name = array_field if target_field == "name" else f"{array_field}_{target_field}"
+        self._wildcard_fields[spec] = (array_field, target_field, clean_name)
+
+    def _compile_instruction(self, instruction: Any) -> Any:
+        """Compile a dict instruction into an _Instruction; other instructions are kept as-is."""
+        if not isinstance(instruction, dict):
+            return instruction
+        fields = instruction.get("fields")
+        return _Instruction(
+            regex=_get_pattern(instruction["regex"]) if "regex" in instruction else None,
+            filter=instruction.get("filter", _MISSING),
+            limit=instruction.get("limit"),
+            fields=fields,
+            field_ops=self._compile_fields(fields) if fields is not None else None,
+            default=instruction.get("default", _MISSING),
+        )
+
+    def _compile_fields(self, fields: List[Union[str, Dict[str, List[str]]]]) -> tuple:
+        """Compile a "fields" list into (op, name, arg) steps for array field selection."""
+        ops = []
+        for field_spec in fields:
+            if isinstance(field_spec, dict):
+                # Nested field spec: {"price": ["amount", "display"]}
+                for field_name, subfields in field_spec.items():
+                    ops.append((OP_NESTED, field_name, subfields))
+            elif isinstance(field_spec, str):
+                # Wildcard path: "categories[*].name"
+                wildcard = self._wildcard_fields.get(field_spec)
+                if wildcard is not None:
+                    ops.append((OP_WILDCARD, field_spec, wildcard))
+                else:
+                    ops.append((OP_FIELD, field_spec, None))
+        return tuple(ops)
+
     def _is_mixed_instruction(self, instruction: Any) -> bool:
         """Check if instruction contains mixed patterns (fields + sub-rules)."""
         return (isinstance(instruction, dict) and 
                 "fields" in instruction and 
-                any(key not in ["fields", "limit", "regex", "default", "filter"] 
-                    for key in instruction.keys()))
+                not instruction.keys() <= _RESERVED_KEYS)
 
     # ------------------------------------------------------------------
     # Public API
@@ -68,57 +234,119 @@ class JSONExtractor:
             Extracted data with same structure (dict or list of dicts)
         """
         if isinstance(data, list):
-            result = [self._extract_one(item) for item in data]
+            result = self._extract_batch(data)
         else:
             result = self._extract_one(data)
 
         return self._convert_model(result)
 
+    def extract_many(self, records: List[Dict]) -> List:
+        """
+        Extract every record of a list in one batch.
+        
+        Args:
+            records: List of input dicts
+            
+        Returns:
+            List of extracted items, converted to the model in a single call
+        """
+        return self._convert_model(self._extract_batch(records))
+
+    def extract_bytes(self, buf: Union[bytes, bytearray, memoryview, str]) -> Union[Dict, List[Dict]]:
+        """Parse a raw JSON document with orjson, without decoding it first, and extract from it."""
+        return self.extract(orjson.loads(buf))
+
     # ------------------------------------------------------------------
     # Core Extraction Logic
     # ------------------------------------------------------------------
 
     def _extract_one(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Extract data from a single item according to all rules."""
+        if self._flat_fields is not None:
+            return self._cleanup_nulls(self._extract_flat_fields(item))
+        
         output = {}
         
-        for path, instruction in self.rules.items():
-            self._process_rule(item, path, instruction, output)
+        for handler, path, instruction in self._plan:
+            handler(item, path, instruction, output)
         
         return self._cleanup_nulls(output)
     
-    def _process_rule(self, item: Dict[str, Any], path: str, instruction: Any, output: Dict[str, Any]) -> None:
+    def _extract_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Extract a list of items with the rule plan and cleanup bound once for the whole batch."""
+        cleanup = self._cleanup_nulls
+        flat_fields = self._flat_fields
+        if flat_fields is not None:
+            return [
+                cleanup({path: item[path] for path in flat_fields if item.get(path) is not None})
+                if isinstance(item, dict) else {}
+                for item in records
+            ]
+        
+        plan = self._plan
+        result = [None] * len(records)
+        for index, item in enumerate(records):
+            output = {}
+            for handler, path, instruction in plan:
+                handler(item, path, instruction, output)
+            result[index] = cleanup(output)
+        return result
+    
+    def _extract_flat_fields(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the plain top-level fields of an item, skipping missing and null ones."""
+        if not isinstance(item, dict):
+            return {}
+        return {
+            path: item[path]
+            for path in self._flat_fields
+            if item.get(path) is not None
+        }
+    
+    def _rule_handler(self, path: str, instruction: Any) -> Callable[[Dict[str, Any], str, Any, Dict[str, Any]], None]:
         """
-        Process a single extraction rule.
+        Choose the handler that processes a single extraction rule.
         
         Args:
-            item: Source data item
             path: JSONPath or field name  
             instruction: Rule configuration
-            output: Target output dictionary
+            
+        Returns:
+            Method called as handler(item, path, instruction, output)
         """
         # Root-level field extraction: "@": {"fields": [...]}
         if path == "@" and isinstance(instruction, dict) and "fields" in instruction:
-            self._extract_root_fields(item, instruction["fields"], output)
-            return
+            return self._process_root_instruction
         
         # Mixed instructions: fields + sub-rules in same object
         if self._is_mixed_instruction(instruction):
-            self._process_mixed_instruction(item, path, instruction, output)
-            return
+            return self._process_mixed_instruction
         
         # Simple nested instruction: {"fields": [...], "limit": 1, ...}
         if isinstance(instruction, dict) and self._is_simple_instruction(instruction):
-            self._process_simple_instruction(item, path, instruction, output)
-            return
+            return self._process_simple_instruction
+        
+        # Plain field name: direct dict lookup
+        if _FIELD_PATH.fullmatch(path):
+            return self._process_field_extraction
+        
+        # Wildcard array paths: "data[*].price"
+        if path in self._wildcard_splits:
+            return self._process_wildcard_extraction
         
         # Standard path-based extraction
-        self._process_path_extraction(item, path, instruction, output)
+        if path in self._compiled:
+            return self._process_path_extraction
+        
+        # Special paths without a supported instruction, e.g. "." or "@": True
+        return self._skip_rule
     
     def _is_simple_instruction(self, instruction: Dict[str, Any]) -> bool:
         """Check if instruction is a simple nested instruction without sub-rules."""
-        instruction_keys = {"fields", "limit", "regex", "default", "filter"}
-        return any(key in instruction for key in instruction_keys)
+        return not instruction.keys().isdisjoint(_RESERVED_KEYS)
+    
+    def _process_root_instruction(self, item: Dict[str, Any], path: str, instruction: _Instruction, output: Dict[str, Any]) -> None:
+        """Process root-level field instruction: "@": {"fields": [...]}."""
+        self._extract_root_fields(item, instruction.fields, output)
     
     def _extract_root_fields(self, item: Dict[str, Any], fields: List[str], output: Dict[str, Any]) -> None:
         """Extract specified fields from root level of item."""
@@ -126,7 +354,7 @@ class JSONExtractor:
             if field in item:
                 output[field] = item[field]
     
-    def _process_mixed_instruction(self, item: Dict[str, Any], path: str, instruction: Dict[str, Any], output: Dict[str, Any]) -> None:
+    def _process_mixed_instruction(self, item: Dict[str, Any], path: str, instruction: _Instruction, output: Dict[str, Any]) -> None:
         """Process instruction containing both fields and sub-rules."""
         if path not in item:
             return
@@ -135,11 +363,11 @@ class JSONExtractor:
         self._process_simple_instruction(item, path, instruction, output)
         
         # Process sub-rules
-        for sub_path, sub_instruction in instruction.items():
-            if sub_path not in ["fields", "limit", "regex", "default", "filter"]:
-                self._process_sub_rule(item[path], sub_path, sub_instruction, output, path)
+        sub_plan = self._sub_plans[path]
+        if sub_plan:
+            self._process_sub_rules(item[path], sub_plan, output, path)
     
-    def _process_simple_instruction(self, item: Dict[str, Any], path: str, instruction: Dict[str, Any], output: Dict[str, Any]) -> None:
+    def _process_simple_instruction(self, item: Dict[str, Any], path: str, instruction: _Instruction, output: Dict[str, Any]) -> None:
         """Process simple nested instruction on a specific path."""
         if path not in item:
             return
@@ -149,20 +377,29 @@ class JSONExtractor:
         output[path] = processed_value
     
     def _process_path_extraction(self, item: Dict[str, Any], path: str, instruction: Any, output: Dict[str, Any]) -> None:
-        """Process standard JMESPath-based extraction."""
-        if path not in self._compiled:
-            return
-            
-        # Extract value using appropriate method
-        if "[*]" in path:
-            value = self._extract_wildcard_path(item, path, instruction)
-        else:
-            value = self._compiled[path].search(item)
-
+        """Process standard path-based extraction."""
+        value = self._compiled[path].search(item)
+        self._assign_extracted(output, path, value, instruction)
+    
+    def _process_wildcard_extraction(self, item: Dict[str, Any], path: str, instruction: Any, output: Dict[str, Any]) -> None:
+        """Process wildcard array extraction like "data[*].price"."""
+        value = self._extract_wildcard_path(item, path, instruction)
+        self._assign_extracted(output, path, value, instruction)
+    
+    def _skip_rule(self, item: Dict[str, Any], path: str, instruction: Any, output: Dict[str, Any]) -> None:
+        """Ignore a rule that extracts nothing."""
+    
+    def _process_field_extraction(self, item: Dict[str, Any], path: str, instruction: Any, output: Dict[str, Any]) -> None:
+        """Process extraction of a plain top-level field, bypassing JMESPath."""
+        value = item.get(path) if isinstance(item, dict) else None
+        self._assign_extracted(output, path, value, instruction)
+    
+    def _assign_extracted(self, output: Dict[str, Any], path: str, value: Any, instruction: Any) -> None:
+        """Process an extracted value and assign it, falling back to the rule default."""
         # Handle missing values
         if value is None:
-            if isinstance(instruction, dict) and "default" in instruction:
-                value = instruction["default"]
+            if isinstance(instruction, _Instruction) and instruction.default is not _MISSING:
+                value = instruction.default
             else:
                 return
 
@@ -176,114 +413,99 @@ class JSONExtractor:
     # Sub-rule Processing
     # ------------------------------------------------------------------
     
-    def _process_sub_rule(self, parent_value: Union[List, Dict], sub_path: str, sub_instruction: Any, 
-                         output: Dict[str, Any], parent_path: str) -> None:
+    def _sub_rule_plan(self, instruction: Dict[str, Any]) -> List[tuple]:
+        """Choose the handler for every sub-rule of a mixed instruction once."""
+        plan = []
+        for sub_path, sub_instruction in instruction.items():
+            if sub_path in _RESERVED_KEYS:
+                continue
+            
+            # Wildcard array paths: "categories[*].name" (check before general field check)
+            wildcard = self._wildcard_fields.get(sub_path)
+            if wildcard is not None:
+                plan.append((self._apply_wildcard_sub_rule, sub_path, wildcard))
+            
+            # Nested object instructions: {"limit": 1, "fields": ["url"]}
+            elif isinstance(sub_instruction, dict):
+                plan.append((self._apply_nested_sub_rule, sub_path, self._compile_instruction(sub_instruction)))
+            
+            # Field list: ["field1", "field2", ...]
+            elif isinstance(sub_instruction, list):
+                plan.append((self._apply_fields_sub_rule, sub_path, sub_instruction))
+            
+            # Boolean flag: True
+            elif sub_instruction is True:
+                plan.append((self._apply_flag_sub_rule, sub_path, sub_instruction))
+        return plan
+    
+    def _process_sub_rules(self, parent_value: Union[List, Dict], sub_plan: List[tuple],
+                          output: Dict[str, Any], parent_path: str) -> None:
         """
-        Process sub-rules within mixed instructions.
+        Process the sub-rules of a mixed instruction in a single pass.
         
         Args:
             parent_value: Value from parent path
-            sub_path: Path of the sub-rule 
-            sub_instruction: Sub-rule configuration
+            sub_plan: Pre-classified sub-rules as (handler, sub_path, spec)
             output: Target output dictionary
             parent_path: Original parent path name
         """
-        if isinstance(parent_value, list):
-            self._process_array_sub_rule(parent_value, sub_path, sub_instruction, output, parent_path)
-        elif isinstance(parent_value, dict):
-            self._process_dict_sub_rule(parent_value, sub_path, sub_instruction, output, parent_path)
-    
-    def _process_array_sub_rule(self, array_value: List, sub_path: str, sub_instruction: Any,
-                               output: Dict[str, Any], parent_path: str) -> None:
-        """Process sub-rule for array values."""
-        new_items = []
-        
-        for i, item in enumerate(array_value):
-            if isinstance(item, dict):
-                # Get existing processed item or create new one
-                if parent_path in output and isinstance(output[parent_path], list) and i < len(output[parent_path]):
-                    new_item = dict(output[parent_path][i])
-                else:
-                    new_item = {}
-                
-                self._apply_sub_rule_to_item(item, sub_path, sub_instruction, new_item)
-                new_items.append(new_item)
-            else:
-                new_items.append(item)
-        
-        # Merge with existing output
-        self._merge_array_output(output, parent_path, new_items)
-    
-    def _process_dict_sub_rule(self, dict_value: Dict, sub_path: str, sub_instruction: Any,
-                              output: Dict[str, Any], parent_path: str) -> None:
-        """Process sub-rule for dictionary values."""
-        if parent_path not in output:
-            output[parent_path] = {}
-        self._apply_sub_rule_to_item(dict_value, sub_path, sub_instruction, output[parent_path])
-    
-    def _merge_array_output(self, output: Dict[str, Any], parent_path: str, new_items: List) -> None:
-        """Merge new items with existing output array."""
-        if parent_path in output and isinstance(output[parent_path], list):
-            merged_items = []
-            for i, existing_item in enumerate(output[parent_path]):
-                if (i < len(new_items) and 
-                    isinstance(existing_item, dict) and isinstance(new_items[i], dict)):
-                    merged_item = dict(existing_item)
-                    merged_item.update(new_items[i])
-                    merged_items.append(merged_item)
-                elif i < len(new_items):
-                    merged_items.append(new_items[i])
-                else:
-                    merged_items.append(existing_item)
-            output[parent_path] = merged_items
-        else:
-            output[parent_path] = new_items
-    
-    def _apply_sub_rule_to_item(self, item: Dict[str, Any], sub_path: str, sub_instruction: Any, target: Dict[str, Any]) -> None:
-        """
-        Apply a sub-rule to a single data item.
-        
-        Args:
-            item: Source data item
-            sub_path: Path within the item
-            sub_instruction: Rule configuration  
-            target: Target dictionary to update
-        """
-        # Wildcard array paths: "categories[*].name" (check before general field check)
-        if "[*]." in sub_path:
-            self._extract_wildcard_field(item, sub_path, target)
-            return
-            
-        if sub_path not in item:
+        if isinstance(parent_value, dict):
+            target = output.setdefault(parent_path, {})
+            self._apply_sub_rules(parent_value, sub_plan, target)
             return
         
-        # Nested object instructions: {"limit": 1, "fields": ["url"]}
-        elif isinstance(sub_instruction, dict):
-            processed_value = self._process_value(item[sub_path], sub_instruction)
-            target[sub_path] = processed_value
+        if not isinstance(parent_value, list):
+            return
         
-        # Field list: ["field1", "field2", ...]
-        elif isinstance(sub_instruction, list):
-            self._extract_fields_from_object(item, sub_path, sub_instruction, target)
+        existing_items = output.get(parent_path)
+        if not isinstance(existing_items, list):
+            existing_items = output[parent_path] = [{} if isinstance(item, dict) else item for item in parent_value]
         
-        # Boolean flag: True
-        elif sub_instruction is True:
+        # Existing items were built by the extractor's field selection, so
+        # the sub-rule fields are written into them directly
+        for i, (existing_item, item) in enumerate(zip(existing_items, parent_value)):
+            if not isinstance(item, dict):
+                existing_items[i] = item
+                continue
+            if not isinstance(existing_item, dict):
+                existing_item = existing_items[i] = {}
+            self._apply_sub_rules(item, sub_plan, existing_item)
+    
+    def _apply_sub_rules(self, item: Dict[str, Any], sub_plan: List[tuple], target: Dict[str, Any]) -> None:
+        """Apply every pre-classified sub-rule to a single data item."""
+        for handler, sub_path, spec in sub_plan:
+            handler(item, sub_path, spec, target)
+    
+    def _apply_wildcard_sub_rule(self, item: Dict[str, Any], sub_path: str, wildcard: tuple, target: Dict[str, Any]) -> None:
+        """Apply a wildcard sub-rule like "categories[*].name"."""
+        self._extract_wildcard_field(item, wildcard, target)
+    
+    def _apply_nested_sub_rule(self, item: Dict[str, Any], sub_path: str, sub_instruction: _Instruction, target: Dict[str, Any]) -> None:
+        """Apply a nested object sub-rule like {"limit": 1, "fields": ["url"]}."""
+        if sub_path in item:
+            target[sub_path] = self._process_value(item[sub_path], sub_instruction)
+    
+    def _apply_fields_sub_rule(self, item: Dict[str, Any], sub_path: str, fields: List[str], target: Dict[str, Any]) -> None:
+        """Apply a field list sub-rule like ["amount", "display"]."""
+        if sub_path in item:
+            self._extract_fields_from_object(item, sub_path, fields, target)
+    
+    def _apply_flag_sub_rule(self, item: Dict[str, Any], sub_path: str, sub_instruction: bool, target: Dict[str, Any]) -> None:
+        """Apply a boolean flag sub-rule that copies the field as-is."""
+        if sub_path in item:
             target[sub_path] = item[sub_path]
     
-    def _extract_wildcard_field(self, item: Dict[str, Any], wildcard_path: str, target: Dict[str, Any]) -> None:
-        """Extract field from array using wildcard syntax."""
-        array_field, target_field = wildcard_path.split("[*].", 1)
+    def _extract_wildcard_field(self, item: Dict[str, Any], wildcard: tuple, target: Dict[str, Any]) -> None:
+        """Extract field from array using a pre-split wildcard spec."""
+        array_field, target_field, clean_name = wildcard
         
-        if array_field in item and isinstance(item[array_field], list):
-            extracted_values = [
+        array = item.get(array_field)
+        if isinstance(array, list):
+            target[clean_name] = [
                 array_item[target_field] 
-                for array_item in item[array_field] 
+                for array_item in array 
                 if isinstance(array_item, dict) and target_field in array_item
             ]
-            
-            # Use clean field name
-            clean_name = array_field if target_field == "name" else f"{array_field}_{target_field}"
-            target[clean_name] = extracted_values
     
     def _extract_fields_from_object(self, item: Dict[str, Any], sub_path: str, fields: List[str], target: Dict[str, Any]) -> None:
         """Extract specific fields from a nested object."""
@@ -302,23 +524,23 @@ class JSONExtractor:
     # Value Processing
     # ------------------------------------------------------------------
     
-    def _process_value(self, value: Any, instruction: Union[Dict[str, Any], Any]) -> Any:
+    def _process_value(self, value: Any, instruction: Union[_Instruction, Any]) -> Any:
         """
         Process extracted value according to instruction rules.
         
         Args:
             value: Extracted value to process
-            instruction: Processing rules
+            instruction: Compiled processing rules
             
         Returns:
             Processed value
         """
-        if not isinstance(instruction, dict):
+        if not isinstance(instruction, _Instruction):
             return value
             
         # Apply regex filtering first
-        if "regex" in instruction and isinstance(value, str):
-            if not re.compile(instruction["regex"]).search(value):
+        if instruction.regex is not None and isinstance(value, str):
+            if not instruction.regex.search(value):
                 return None
         
         # Handle different value types
@@ -329,41 +551,41 @@ class JSONExtractor:
         else:
             return value
     
-    def _process_dict_value(self, value: Dict[str, Any], instruction: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_dict_value(self, value: Dict[str, Any], instruction: _Instruction) -> Dict[str, Any]:
         """Process dictionary value with field selection."""
-        if "fields" in instruction:
+        if instruction.fields is not None:
             return {
                 field: value[field] 
-                for field in instruction["fields"] 
+                for field in instruction.fields 
                 if field in value
             }
         return value
     
-    def _process_array_value(self, value: List[Any], instruction: Dict[str, Any]) -> List[Any]:
+    def _process_array_value(self, value: List[Any], instruction: _Instruction) -> List[Any]:
         """Process array value with filtering, limiting, and field selection."""
         processed = value
         
         # Apply regex filter to array elements
-        if "regex" in instruction:
-            pattern = re.compile(instruction["regex"])
+        if instruction.regex is not None:
+            pattern = instruction.regex
             processed = [item for item in processed if isinstance(item, str) and pattern.search(item)]
         
         # Apply custom filter function
-        if "filter" in instruction:
-            processed = list(filter(instruction["filter"], processed))
+        if instruction.filter is not _MISSING:
+            processed = list(filter(instruction.filter, processed))
         
         # Apply length limit
-        if "limit" in instruction:
-            processed = processed[:instruction["limit"]]
+        if instruction.limit is not None:
+            processed = processed[:instruction.limit]
         
         # Apply field selection to array elements
-        if "fields" in instruction:
-            processed = self._extract_fields_from_array(processed, instruction["fields"])
+        if instruction.field_ops is not None:
+            processed = self._extract_fields_from_array(processed, instruction.field_ops)
         
         return processed
     
-    def _extract_fields_from_array(self, array: List[Any], fields: List[Union[str, Dict[str, List[str]]]]) -> List[Dict[str, Any]]:
-        """Extract specified fields from each dict in array."""
+    def _extract_fields_from_array(self, array: List[Any], field_ops: tuple) -> List[Dict[str, Any]]:
+        """Extract the fields of a compiled "fields" list from each dict in array."""
         result = []
         
         for item in array:
@@ -373,33 +595,21 @@ class JSONExtractor:
                 
             extracted = {}
             
-            for field_spec in fields:
-                if isinstance(field_spec, dict):
-                    # Nested field spec: {"price": ["amount", "display"]}
-                    for field_name, subfields in field_spec.items():
-                        if field_name in item and isinstance(item[field_name], dict):
-                            extracted[field_name] = {
-                                sf: item[field_name][sf] 
-                                for sf in subfields 
-                                if sf in item[field_name]
-                            }
-                        elif field_name in item:
-                            extracted[field_name] = item[field_name]
+            for op, name, arg in field_ops:
+                if op == OP_FIELD:
+                    if name in item:
+                        extracted[name] = item[name]
                 
-                elif isinstance(field_spec, str):
-                    if "[*]." in field_spec:
-                        # Wildcard path: "categories[*].name" 
-                        array_field, target_field = field_spec.split("[*].", 1)
-                        if array_field in item and isinstance(item[array_field], list):
-                            extracted_values = [
-                                array_item[target_field] 
-                                for array_item in item[array_field] 
-                                if isinstance(array_item, dict) and target_field in array_item
-                            ]
-                            clean_name = array_field if target_field == "name" else f"{array_field}_{target_field}"
-                            extracted[clean_name] = extracted_values
-                    elif field_spec in item:
-                        extracted[field_spec] = item[field_spec]
+                elif op == OP_WILDCARD:
+                    self._extract_wildcard_field(item, arg, extracted)
+                
+                elif name in item:
+                    # Nested field spec: {"price": ["amount", "display"]}
+                    value = item[name]
+                    if isinstance(value, dict):
+                        extracted[name] = {sf: value[sf] for sf in arg if sf in value}
+                    else:
+                        extracted[name] = value
             
             result.append(extracted)
         
@@ -421,31 +631,31 @@ class JSONExtractor:
         Returns:
             List of extracted values
         """
-        if "[*]." not in path:
-            return self._compiled[path].search(item)
-            
-        array_path, field_path = path.split("[*].", 1)
+        array_path, field_path = self._wildcard_splits[path]
+        field_expression = self._compiled_sub.get(field_path)
+        fields = instruction.fields if isinstance(instruction, _Instruction) else None
         
-        if array_path not in item or not isinstance(item[array_path], list):
+        array = item.get(array_path) if isinstance(item, dict) else None
+        if not isinstance(array, list):
             return []
         
         results = []
-        for array_item in item[array_path]:
+        for array_item in array:
             if not isinstance(array_item, dict):
                 continue
                 
             # Extract field value (supports nested paths)
-            if "." in field_path:
-                field_value = jmespath.compile(field_path).search(array_item)
+            if field_expression is not None:
+                field_value = field_expression.search(array_item)
             else:
                 field_value = array_item.get(field_path)
             
             if field_value is not None:
                 # Apply field filtering if specified
-                if isinstance(instruction, dict) and "fields" in instruction and isinstance(field_value, dict):
+                if fields is not None and isinstance(field_value, dict):
                     field_value = {
                         f: field_value[f] 
-                        for f in instruction["fields"] 
+                        for f in fields 
                         if f in field_value
                     }
                 results.append(field_value)
@@ -465,7 +675,7 @@ class JSONExtractor:
             path: Dot-separated path (e.g., "data.items")
             value: Value to assign
         """
-        keys = path.replace("[*]", "").split(".")
+        keys = self._assign_keys[path]
         current = output
         
         # Navigate to parent key
@@ -481,7 +691,10 @@ class JSONExtractor:
 
     def _cleanup_nulls(self, obj: Any) -> Any:
         """
-        Remove null values from nested structures recursively.
+        Remove null values from nested structures.
+        
+        Most extracted items hold no nulls, so they are first looked for with
+        a flat stack walk; the tree is only rebuilt when one is found.
         
         Args:
             obj: Object to clean
@@ -489,23 +702,61 @@ class JSONExtractor:
         Returns:
             Object with null values removed
         """
+        if not self._contains_nulls(obj):
+            return obj
+        return self._prune_nulls(obj)
+
+    def _contains_nulls(self, obj: Any) -> bool:
+        """Check for null values anywhere in nested structures, without recursion."""
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                current = current.values()
+            elif not isinstance(current, list):
+                continue
+            for value in current:
+                if value is None:
+                    return True
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+        return False
+
+    def _prune_nulls(self, obj: Any) -> Any:
+        """
+        Remove null values from nested structures recursively.
+        
+        Containers without nulls are returned as-is; a container is only
+        copied once a null is found in it, so the input is never mutated.
+        """
         if isinstance(obj, dict):
-            return {
-                key: self._cleanup_nulls(value)
-                for key, value in obj.items()
-                if value is not None
-            }
+            cleaned = None
+            for index, (key, value) in enumerate(obj.items()):
+                new_value = self._prune_nulls(value) if isinstance(value, (dict, list)) else value
+                if cleaned is None:
+                    if new_value is value and value is not None:
+                        continue
+                    # First change found: copy the untouched entries before it
+                    cleaned = dict(islice(obj.items(), index))
+                if new_value is not None:
+                    cleaned[key] = new_value
+            return obj if cleaned is None else cleaned
         elif isinstance(obj, list):
-            return [
-                self._cleanup_nulls(item) 
-                for item in obj 
-                if item is not None
-            ]
+            cleaned = None
+            for index, item in enumerate(obj):
+                new_item = self._prune_nulls(item) if isinstance(item, (dict, list)) else item
+                if cleaned is None:
+                    if new_item is item and item is not None:
+                        continue
+                    cleaned = obj[:index]
+                if new_item is not None:
+                    cleaned.append(new_item)
+            return obj if cleaned is None else cleaned
         return obj
 
     def _convert_model(self, data: Union[Dict, List[Dict]]) -> Union[Dict, List[Dict]]:
         """
-        Convert extracted data to Pydantic model if specified.
+        Convert extracted data to Pydantic model or msgspec Struct if specified.
         
         Args:
             data: Extracted data
@@ -516,6 +767,9 @@ class JSONExtractor:
         if self.model is None:
             return data
 
+        if self._is_struct:
+            return msgspec.convert(data, type=list[self.model] if isinstance(data, list) else self.model)
+
         if isinstance(data, list):
-            return [self.model(**item) for item in data]
-        return self.model(**data)
+            return self._list_adapter.validate_python(data)
+        return self.model.model_validate(data)
@@ -3,11 +3,58 @@
 import asyncio
 import functools
 import inspect
-from typing import Any, Awaitable, Callable, Generator, Iterable, List, TypeVar, Union
+import time
+from contextlib import nullcontext
+from typing import Any, Awaitable, Callable, Generator, Iterable, List, Optional, TypeVar, Union
 
 T = TypeVar('T')
 
 
+class TokenBucket:
+    """
+    Token bucket that limits how often tasks may start.
+
+    Tokens refill continuously at `rate_per_sec` up to `capacity`, so healthy
+    bursts start immediately and only callers that outrun the rate wait.
+
+    Usage:
+        bucket = TokenBucket(rate_per_sec=2)
+        await bucket.acquire()
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float = 1.0):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate_per_sec: Number of tokens added per second
+            capacity: Maximum number of tokens that can accumulate (burst size)
+        """
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_sec)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until `tokens` are available and consume them."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # Waiters are served in arrival order while the lock is held
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate_per_sec)
+                self._refill()
+            self._tokens -= tokens
+
+
 class ParallelExecution:
     """Decorator for running functions in parallel using asyncio.gather."""
     
@@ -114,39 +161,35 @@ async def gather_with_limit(
     """
     Execute tasks in parallel with optional concurrency limit and delay.
     
+    Concurrency is bounded by a semaphore, so a new task starts as soon as any
+    running task finishes, and the delay is enforced by a token bucket, so
+    tasks never wait longer than needed to keep the start rate.
+
     Args:
         tasks: Iterable of awaitable tasks
         max_concurrency: Maximum concurrent tasks (None for unlimited)
         return_exceptions: Whether to return exceptions as results
-        delay: Delay between starting each task
+        delay: Minimum delay between starting each task
     
     Returns:
         List of results in the same order as input tasks
     """
     task_list = list(tasks)
-    
-    # Add delays if specified
-    if delay > 0:
-        async def delayed_task(task, delay_time):
-            if delay_time > 0:
-                await asyncio.sleep(delay_time)
-            return await task
-        
-        task_list = [
-            delayed_task(task, i * delay) 
-            for i, task in enumerate(task_list)
-        ]
-    
-    if max_concurrency and len(task_list) > max_concurrency:
-        results = []
-        for i in range(0, len(task_list), max_concurrency):
-            batch = task_list[i:i + max_concurrency]
-            batch_results = await asyncio.gather(*batch, return_exceptions=return_exceptions)
-            results.extend(batch_results)
-        return results
-    else:
+
+    if not max_concurrency and delay <= 0:
         return await asyncio.gather(*task_list, return_exceptions=return_exceptions)
 
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else nullcontext()
+    bucket = TokenBucket(rate_per_sec=1.0 / delay) if delay > 0 else None
+
+    async def limited_task(task: Awaitable[T]) -> T:
+        async with semaphore:
+            if bucket:
+                await bucket.acquire()
+            return await task
+
+    return await asyncio.gather(*[limited_task(task) for task in task_list], return_exceptions=return_exceptions)
+
 
 # Convenience decorator for simple cases
 def parallel(func):
@@ -3,9 +3,10 @@
 import asyncio
 import logging
 import os
+import re
 import time
 from pathlib import Path
-from typing import Awaitable, Callable, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 import httpx
 
@@ -87,6 +88,103 @@ class RateLimiter:
         self.request_times.append(time.time())
 
 
+# Matches OpenAI reset durations such as "20ms", "1s" or "6m0s"
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """Parse a rate limit reset header value into seconds."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    matches = _DURATION_PATTERN.findall(value)
+    if not matches:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in matches)
+
+
+class RateLimitState:
+    """Proactive rate limit tracker fed by the provider response headers."""
+
+    def __init__(self, provider_name: str, min_remaining_requests: int = 2, min_remaining_ratio: float = 0.1):
+        self.provider_name = provider_name
+        self.min_remaining_requests = min_remaining_requests
+        self.min_remaining_ratio = min_remaining_ratio
+
+        self.limit_requests: Optional[int] = None
+        self.remaining_requests: Optional[int] = None
+        self.limit_tokens: Optional[int] = None
+        self.remaining_tokens: Optional[int] = None
+        self.resume_at = 0.0
+
+    @staticmethod
+    def _get_int(headers: Any, *names: str) -> Optional[int]:
+        for name in names:
+            value = headers.get(name)
+            if value is not None:
+                try:
+                    return int(float(value))
+                except ValueError:
+                    continue
+        return None
+
+    def _is_low(self, remaining: Optional[int], limit: Optional[int]) -> bool:
+        if remaining is None or not limit:
+            return False
+        return remaining < limit * self.min_remaining_ratio
+
+    def update_from_headers(self, headers: Any) -> None:
+        """Update the remaining budget from rate limit response headers."""
+        if not headers:
+            return
+
+        self.limit_requests = self._get_int(headers, "x-ratelimit-limit-requests", "anthropic-ratelimit-requests-limit")
+        self.remaining_requests = self._get_int(headers, "x-ratelimit-remaining-requests", "anthropic-ratelimit-requests-remaining")
+        self.limit_tokens = self._get_int(headers, "x-ratelimit-limit-tokens", "anthropic-ratelimit-tokens-limit")
+        self.remaining_tokens = self._get_int(headers, "x-ratelimit-remaining-tokens", "anthropic-ratelimit-tokens-remaining")
+
+        now = time.monotonic()
+        retry_after = parse_reset_duration(headers.get("retry-after"))
+        if retry_after:
+            self.resume_at = max(self.resume_at, now + retry_after)
+            return
+
+        requests_exhausted = (self.remaining_requests is not None and self.remaining_requests <= self.min_remaining_requests) \
+            or self._is_low(self.remaining_requests, self.limit_requests)
+        tokens_exhausted = self._is_low(self.remaining_tokens, self.limit_tokens)
+
+        wait_time = 0.0
+        if requests_exhausted:
+            wait_time = max(wait_time, parse_reset_duration(headers.get("x-ratelimit-reset-requests")) or 0.0)
+        if tokens_exhausted:
+            wait_time = max(wait_time, parse_reset_duration(headers.get("x-ratelimit-reset-tokens")) or 0.0)
+
+        if wait_time > 0:
+            self.resume_at = max(self.resume_at, now + wait_time)
+
+    async def wait_if_throttled(self) -> None:
+        """Sleep until the provider budget resets when it is nearly exhausted."""
+        wait_time = self.resume_at - time.monotonic()
+        if wait_time > 0:
+            logger.info(f"[{self.provider_name}] Rate limit budget low "
+                        f"(requests={self.remaining_requests}, tokens={self.remaining_tokens}), waiting {wait_time:.1f}s")
+            await asyncio.sleep(wait_time)
+
+
+# Per-provider rate limit state shared across provider instances
+_rate_limit_states: dict[str, RateLimitState] = {}
+
+def get_rate_limit_state(provider_name: str) -> RateLimitState:
+    """Get or create the rate limit state for a provider."""
+    if provider_name not in _rate_limit_states:
+        _rate_limit_states[provider_name] = RateLimitState(provider_name)
+    return _rate_limit_states[provider_name]
+
+
 class RetryableError(Exception):
     """Base class for errors that should trigger a retry."""
 
@@ -5,13 +5,28 @@ String utility functions for text processing.
 import re
 from typing import Any
 
+import numpy as np
+import orjson
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+# Byte lookup table matching \w for ASCII text
+_ASCII_WORD_BYTES = np.zeros(128, dtype=bool)
+_ASCII_WORD_BYTES[list(b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz")] = True
+
 def count_chars(text: str) -> int:
     """Return the number of characters in the given text."""
     return len(text)
 
 def count_words(text: str) -> int:
     """Return the number of words in the given text."""
-    return len(re.findall(r'\w+', text))
+    if not text.isascii():
+        return len(_WORD_PATTERN.findall(text))
+    if not text:
+        return 0
+    # ASCII fast path: count the word-character runs with vectorized byte ops
+    is_word = _ASCII_WORD_BYTES[np.frombuffer(text.encode('ascii'), dtype=np.uint8)]
+    return int(is_word[0]) + int(np.count_nonzero(is_word[1:] & ~is_word[:-1]))
 
 def count_lines(text: str) -> int:
     """Return the number of lines in the given text."""
@@ -19,14 +34,21 @@ def count_lines(text: str) -> int:
         return 0
     return text.count('\n') + 1
 
+def _to_jsonable(obj: Any) -> Any:
+    """Fallback for orjson: convert unsupported objects to serializable data."""
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump(mode='json')
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    return str(obj)
+
 def object_to_str(obj: Any) -> str:
     """Convert an object to a string representation for hashing."""
+    if isinstance(obj, str):
+        return obj
     if hasattr(obj, 'model_dump_json'):
         return obj.model_dump_json()
-    elif hasattr(obj, 'json'):
-        return obj.json()
-    elif hasattr(obj, '__dict__'):
-        return str(obj.__dict__)
-    else:
+    try:
+        return orjson.dumps(obj, default=_to_jsonable, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
         return str(obj)
-    
\ No newline at end of file
@@ -159,4 +159,4 @@ if [ -z "$server_port" ]; then
 fi
 
 # Run with uv and uvicorn
-exec uv run uvicorn app.main:app --reload --host "$server_host" --port "$server_port"
\ No newline at end of file
+exec uv run uvicorn app.main:app --reload --host "$server_host" --port "$server_port" --loop uvloop --http httptools
\ No newline at end of file
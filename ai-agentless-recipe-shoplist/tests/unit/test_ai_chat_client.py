@@ -0,0 +1,49 @@
+"""
+Unit tests for AIChatClient prompt building.
+"""
+
+import asyncio
+
+from app.client.ai_chat_client import AIChatClient
+from app.models import ChatCompletionResult, Ingredient
+
+
+class FakeProvider:
+    """Provider that records the chat params it is called with."""
+
+    max_tokens = 60
+
+    def __init__(self):
+        self.calls = []
+
+    async def complete_chat(self, params):
+        self.calls.append(params)
+        return ChatCompletionResult(success=True, content=None)
+
+
+class CharTokenizer:
+    """Tokenizer counting one token per character, so no encoding download is needed."""
+
+    def truncate_to_token_limit(self, text: str, max_tokens: int) -> str:
+        return text[:max_tokens]
+
+
+class TestSearchBestMatchProductsBatch:
+    """Test suite for AIChatClient.search_best_match_products_batch."""
+
+    def test_every_ingredient_keeps_a_share_of_the_token_budget(self):
+        provider = FakeProvider()
+        client = AIChatClient.__new__(AIChatClient)
+        client.name = "AIChatClient"
+        client.provider = provider
+        client.tokenizer = CharTokenizer()
+        names = ["tomato", "eggs", "zucchini"]
+        ingredients = [Ingredient(name=name, original_text=name) for name in names]
+        fetch_content = {name: [{"name": f"{name} product {i}", "price": i} for i in range(50)] for name in names}
+
+        asyncio.run(client.search_best_match_products_batch(ingredients, fetch_content))
+
+        store_prompt = provider.calls[0]["messages"][1]["content"]
+        lines = store_prompt.splitlines()[1:]
+        assert [line.split(":", 1)[0] for line in lines] == names
+        assert all(len(line) == provider.max_tokens // len(names) for line in lines)
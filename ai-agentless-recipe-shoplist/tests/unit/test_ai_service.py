@@ -0,0 +1,88 @@
+"""
+Unit tests for AIService batch product matching.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.models import BatchShoppingListResult, ChatCompletionResult, Ingredient, Product, ShoppingListItem
+from app.services.ai_service import AIService
+
+
+def _ingredient(name: str) -> Ingredient:
+    return Ingredient(name=name, original_text=name)
+
+
+def _item(name: str, product_name: str) -> ShoppingListItem:
+    product = Product.default().model_copy(update={"name": product_name})
+    return ShoppingListItem(ingredient=_ingredient(name), selected_product=product, quantity=1)
+
+
+class FakeChatClient:
+    """Chat client returning canned batch and per-ingredient matches."""
+
+    def __init__(self, batch_items: list[ShoppingListItem]):
+        self.batch_items = batch_items
+        self.batch_calls = []
+        self.single_calls = []
+
+    async def search_best_match_products_batch(self, ingredients, fetch_content):
+        self.batch_calls.append(([ingredient.name for ingredient in ingredients], list(fetch_content)))
+        return ChatCompletionResult(success=True, content=BatchShoppingListResult(items=self.batch_items))
+
+    async def search_best_match_products(self, ingredient, fetch_content):
+        self.single_calls.append(ingredient.name)
+        product = Product.default().model_copy(update={"name": f"{ingredient.name} product", "price": 2.0, "quantity": 2})
+        return ChatCompletionResult(success=True, content=product)
+
+
+class TestSearchStoreBatch:
+    """Test suite for AIService._search_store_batch."""
+
+    def _service(self, chat_client: FakeChatClient, failing: set[str] = frozenset()) -> AIService:
+        service = AIService.__new__(AIService)
+        service.name = "AIService"
+        service.ai_chat_client = chat_client
+
+        async def scrape(ingredient, store):
+            if ingredient.name in failing:
+                raise ValueError("scrape failed")
+            return [{"name": ingredient.name}]
+
+        service._scrape_grocery_product = scrape
+        return service
+
+    def test_items_are_matched_by_position(self):
+        chat_client = FakeChatClient([_item("Tomatoes", "Cherry Tomatoes"), _item("egg", "Free Range Eggs")])
+        service = self._service(chat_client)
+        store = SimpleNamespace(name="Aldi", store_id="aldi")
+
+        items, ai_stats = asyncio.run(service._search_store_batch([_ingredient("tomato"), _ingredient("eggs")], store))
+
+        assert items[0].selected_product.name == "Cherry Tomatoes"
+        assert items[1].selected_product.name == "Free Range Eggs"
+        assert len(ai_stats) == 1
+
+    def test_failed_scrapes_are_not_sent_to_the_ai(self):
+        chat_client = FakeChatClient([_item("eggs", "Free Range Eggs")])
+        service = self._service(chat_client, failing={"tomato"})
+        store = SimpleNamespace(name="Aldi", store_id="aldi")
+
+        items, _ = asyncio.run(service._search_store_batch([_ingredient("tomato"), _ingredient("eggs")], store))
+
+        assert chat_client.batch_calls == [(["eggs"], ["eggs"])]
+        assert list(items) == [1]
+        assert items[1].selected_product.name == "Free Range Eggs"
+
+    def test_item_count_mismatch_falls_back_to_one_by_one(self):
+        chat_client = FakeChatClient([_item("tomato", "Cherry Tomatoes")])
+        service = self._service(chat_client)
+        store = SimpleNamespace(name="Aldi", store_id="aldi")
+
+        items, ai_stats = asyncio.run(service._search_store_batch([_ingredient("tomato"), _ingredient("eggs")], store))
+
+        assert chat_client.single_calls == ["tomato", "eggs"]
+        assert items[1].selected_product.name == "eggs product"
+        assert items[1].ingredient.name == "eggs"
+        assert items[1].total_cost == 4.0
+        assert len(ai_stats) == 3
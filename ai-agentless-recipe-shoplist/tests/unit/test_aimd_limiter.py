@@ -0,0 +1,92 @@
+"""
+Unit tests for the AIMD concurrency limiter.
+"""
+
+import asyncio
+
+import pytest
+
+from app.utils.aimd_limiter import AIMDLimiter
+from app.utils.retry_utils import RateLimitError
+
+
+class TestAIMDLimiter:
+    """Test suite for AIMDLimiter functionality."""
+
+    def test_additive_increase_on_healthy_latency(self):
+        """Concurrency grows by the increase step while latency is under target."""
+        limiter = AIMDLimiter(initial_concurrency=2, increase=0.5, target_latency=1.0)
+
+        limiter.on_latency(0.1)
+        limiter.on_latency(0.1)
+
+        assert limiter.concurrency == 3.0
+        assert limiter.limit == 3
+
+    def test_no_increase_on_slow_latency(self):
+        """Concurrency does not grow when the rolling mean exceeds the target."""
+        limiter = AIMDLimiter(initial_concurrency=2, target_latency=1.0)
+
+        limiter.on_latency(5.0)
+
+        assert limiter.concurrency == 2
+
+    def test_increase_capped_at_max(self):
+        """Concurrency never exceeds max_concurrency."""
+        limiter = AIMDLimiter(initial_concurrency=4, max_concurrency=4, target_latency=1.0)
+
+        limiter.on_latency(0.1)
+
+        assert limiter.limit == 4
+
+    def test_multiplicative_decrease_on_congestion(self):
+        """Congestion halves the window, once per target latency period."""
+        limiter = AIMDLimiter(initial_concurrency=8, decrease=0.5, target_latency=60.0)
+
+        limiter.on_congestion()
+        limiter.on_congestion()
+
+        assert limiter.concurrency == 4.0
+
+    def test_decrease_floored_at_min(self):
+        """Concurrency never drops below min_concurrency."""
+        limiter = AIMDLimiter(initial_concurrency=1, min_concurrency=1, target_latency=0.0)
+
+        limiter.on_congestion()
+        limiter.on_congestion()
+
+        assert limiter.limit == 1
+
+    def test_run_respects_limit(self):
+        """No more than `limit` calls run at the same time."""
+        limiter = AIMDLimiter(initial_concurrency=2, max_concurrency=2)
+        peak = 0
+
+        async def work(value):
+            nonlocal peak
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        async def main():
+            return await asyncio.gather(*[limiter.run(work, i) for i in range(6)])
+
+        results = asyncio.run(main())
+
+        assert results == [0, 2, 4, 6, 8, 10]
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    def test_slot_backs_off_on_rate_limit_error(self):
+        """Rate limit errors inside a slot shrink the window and propagate."""
+        limiter = AIMDLimiter(initial_concurrency=4, decrease=0.5)
+
+        async def main():
+            async with limiter.slot():
+                raise RateLimitError("429")
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(main())
+
+        assert limiter.concurrency == 2.0
+        assert limiter.in_flight == 0
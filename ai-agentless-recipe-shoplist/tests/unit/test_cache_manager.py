@@ -0,0 +1,28 @@
+"""
+Unit tests for the in-memory CacheManager.
+"""
+
+from app.storage.cache_manager import CacheManager
+
+
+class TestCacheManagerTTL:
+    """Test suite for per-entry cache expiry."""
+
+    def setup_method(self):
+        self.manager = CacheManager(ttl=60)
+        self.manager.enabled = True
+
+    def test_entries_use_the_default_ttl(self):
+        self.manager.save("a", "content", alias="html")
+
+        loaded = self.manager.load("a", alias="html")
+
+        assert loaded["data"] == "content"
+        assert loaded["ttl"] == 60
+
+    def test_entries_expire_after_their_own_ttl(self):
+        self.manager.save("a", "content", alias="json", ttl=0)
+        self.manager.save("b", "content", alias="json")
+
+        assert self.manager.load("a", alias="json") is None
+        assert self.manager.load("b", alias="json") is not None
@@ -0,0 +1,190 @@
+"""
+Unit tests for DBManager batched commits, serialization and background saves.
+"""
+
+import asyncio
+
+import pytest
+
+from app.config.pydantic_config import DB_MANAGER_SETTINGS
+from app.models import ChatCompletionResult, Product
+from app.storage.db_manager import DBManager
+
+
+class TestDBManagerBatching:
+    """Test suite for DBManager group commit functionality."""
+
+    @pytest.fixture(autouse=True)
+    def setup_manager(self, tmp_path):
+        self.manager = DBManager(db_path=str(tmp_path / "test.db"))
+        self.manager.enabled = True
+        self.manager._batch_size = 3
+
+    def test_writes_are_buffered_until_batch_is_full(self):
+        self.manager.save("a", {"value": 1})
+        self.manager.save("b", {"value": 2})
+
+        assert len(self.manager._pending) == 2
+        assert list(self.manager._iter_keys()) == []
+
+        self.manager.save("c", {"value": 3})
+
+        assert self.manager._pending == {}
+        assert len(list(self.manager._iter_keys())) == 3
+
+    def test_buffered_writes_are_readable(self):
+        self.manager.save("a", {"value": 1}, alias="processed")
+
+        loaded = self.manager.load("a", alias="processed")
+
+        assert loaded["data"] == {"value": 1}
+        assert loaded["data_from"] == "local_db"
+
+    def test_flush_commits_pending_writes(self):
+        self.manager.save("a", {"value": 1})
+
+        self.manager.flush()
+
+        assert self.manager._pending == {}
+        assert len(list(self.manager._iter_keys())) == 1
+
+
+class TestDBManagerSerialization:
+    """Test suite for DBManager entry serialization."""
+
+    @pytest.fixture(autouse=True)
+    def setup_manager(self, tmp_path):
+        self.manager = DBManager(db_path=str(tmp_path / "test.db"))
+        self.manager.enabled = True
+
+    def test_pydantic_models_are_stored_as_plain_data(self):
+        result = ChatCompletionResult(success=True, content=Product.default())
+
+        self.manager.save("a", result)
+        loaded = self.manager.load("a")
+
+        assert Product.model_validate(loaded["data"]["content"]) == Product.default()
+
+    def test_large_entries_are_compressed(self):
+        html = "<div class='product'>Tomato</div>" * 500
+
+        self.manager.save("a", html)
+        self.manager.flush()
+
+        hash_key = self.manager._get_hash("a", "source")
+        (stored,) = self.manager.db.execute("SELECT v FROM kv WHERE k = ?", (hash_key,)).fetchone()
+        assert stored[:1] in (b"Z", b"z")
+        assert len(stored) < len(html)
+        self.manager._mem_cache.clear()
+        assert self.manager.load("a")["data"] == html
+
+    def test_string_entries_round_trip_with_metadata(self):
+        self.manager.save("a", "<p>Tomato \u00e9</p>", alias="processed", format="html")
+        self.manager.flush()
+
+        hash_key = self.manager._get_hash("a", "processed")
+        (stored,) = self.manager.db.execute("SELECT v FROM kv WHERE k = ?", (hash_key,)).fetchone()
+        assert stored[:1] == b"S"
+        self.manager._mem_cache.clear()
+        loaded = self.manager.load("a", alias="processed")
+        assert loaded["data"] == "<p>Tomato \u00e9</p>"
+        assert loaded["alias"] == "processed"
+        assert loaded["data_format"] == "html"
+        assert loaded["hash_key"] == hash_key
+
+
+class TestDBManagerMemoryCache:
+    """Test suite for the DBManager in-memory entry cache."""
+
+    @pytest.fixture(autouse=True)
+    def setup_manager(self, tmp_path):
+        self.manager = DBManager(db_path=str(tmp_path / "test.db"))
+        self.manager.enabled = True
+
+    def test_repeated_loads_are_served_from_memory(self, monkeypatch):
+        self.manager.save("a", {"value": 1})
+        self.manager.load("a")
+
+        monkeypatch.setattr(self.manager, "exists", lambda key: pytest.fail("database was queried"))
+        loaded = self.manager.load("a")
+
+        assert loaded["data"] == {"value": 1}
+
+    def test_save_invalidates_cached_entry(self):
+        self.manager.save("a", {"value": 1})
+        self.manager.load("a")
+
+        self.manager.save("a", {"value": 2})
+
+        assert self.manager.load("a")["data"] == {"value": 2}
+
+
+class TestDBManagerKeys:
+    """Test suite for DBManager key tracking."""
+
+    def test_keys_are_loaded_on_open(self, tmp_path):
+        db_path = str(tmp_path / "test.db")
+        manager = DBManager(db_path=db_path)
+        manager.enabled = True
+        manager.save("a", {"value": 1})
+        manager.flush()
+        manager.db.close()
+
+        reopened = DBManager(db_path=db_path)
+
+        assert reopened.exists(reopened._get_hash("a", "source"))
+        assert list(reopened.all_keys()) == [reopened._get_hash("a", "source")]
+
+    def test_delete_removes_buffered_and_committed_keys(self, tmp_path):
+        manager = DBManager(db_path=str(tmp_path / "test.db"))
+        manager.enabled = True
+        manager.save("a", {"value": 1})
+        hash_key = manager._get_hash("a", "source")
+
+        assert manager.delete(hash_key) is True
+        assert manager.exists(hash_key) is False
+        assert manager.delete(hash_key) is False
+
+    def test_disabled_database_is_never_opened(self, tmp_path):
+        db_path = tmp_path / "missing" / "test.db"
+        manager = DBManager(db_path=str(db_path))
+        manager.enabled = False
+
+        manager.save("a", {"value": 1})
+
+        assert manager.load("a") is None
+        assert manager._db is None
+        assert not db_path.parent.exists()
+
+
+class TestDBManagerBackgroundWriter:
+    """Test suite for DBManager background saves."""
+
+    @pytest.fixture(autouse=True)
+    def setup_manager(self, tmp_path):
+        self.manager = DBManager(db_path=str(tmp_path / "test.db"))
+        self.manager.enabled = True
+
+    def test_queued_saves_are_written_on_drain(self):
+        async def main():
+            self.manager.save_in_background("a", {"value": 1})
+            self.manager.save_in_background("b", {"value": 2})
+            await self.manager.drain()
+
+        asyncio.run(main())
+
+        assert self.manager.load("a")["data"] == {"value": 1}
+        assert len(list(self.manager._iter_keys())) == 2
+
+    def test_full_queue_drops_oldest_save(self, monkeypatch):
+        monkeypatch.setattr(DB_MANAGER_SETTINGS, "write_queue_size", 1)
+
+        async def main():
+            self.manager.save_in_background("a", {"value": 1})
+            self.manager.save_in_background("b", {"value": 2})
+            await self.manager.drain()
+
+        asyncio.run(main())
+
+        assert self.manager.load("a") is None
+        assert self.manager.load("b")["data"] == {"value": 2}
@@ -0,0 +1,70 @@
+"""
+Unit tests for HTMLScraper background saves.
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from app.scrapers.html_scraper import HTMLScraper
+from app.storage.blob_manager import BlobManager
+
+
+class BlobOnlyStorage:
+    """Content storage writing straight to a blob manager."""
+
+    def __init__(self, blob_manager: BlobManager):
+        self.blob_manager = blob_manager
+
+    async def save_fetch(self, key: str, data, **kwargs) -> None:
+        await self.blob_manager.save(key, data, format=kwargs.get("format", "html"), alias=kwargs.get("alias", "html"))
+
+    async def load_fetch(self, key: str, **kwargs):
+        return None
+
+
+class FakeWebFetcher:
+    """Web fetcher returning a large canned page."""
+
+    def __init__(self, content: str):
+        self.content = content
+
+    async def fetch_url(self, url: str) -> dict:
+        return {"url": url, "data": self.content}
+
+
+class TestHTMLScraperSaves:
+    """Test suite for HTMLScraper background saves."""
+
+    def _scraper(self, base_path: Path, content: str) -> HTMLScraper:
+        blob_manager = BlobManager(base_path)
+        blob_manager.enabled = True
+        scraper = HTMLScraper.__new__(HTMLScraper)
+        scraper.name = "HTMLScraper"
+        scraper.content_storage = BlobOnlyStorage(blob_manager)
+        scraper.web_fetcher = FakeWebFetcher(content)
+        scraper._pending_saves = set()
+        scraper._latest_save = {}
+        return scraper
+
+    def test_processed_save_wins_over_raw_save(self):
+        url = "https://example.com/search?q=tomato"
+        raw_html = "<html>" + "x" * 200_000 + "</html>"
+
+        def html_processor(raw_data):
+            return {"data": "processed", "data_processed_format": "html"}
+
+        async def run(scraper: HTMLScraper):
+            fetched = await scraper._fetch(url, "html")
+            await scraper._process(url, fetched["data"], html_processor)
+            await scraper.flush()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            base_path = Path(tmp)
+            scraper = self._scraper(base_path, raw_html)
+            asyncio.run(run(scraper))
+
+            filename = scraper.content_storage.blob_manager._get_hash(url, "html")
+            assert (base_path / f"{filename}.html").read_text(encoding="utf-8") == "processed"
+            assert not scraper._pending_saves
+            assert not scraper._latest_save
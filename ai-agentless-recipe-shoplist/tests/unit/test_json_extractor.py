@@ -5,11 +5,15 @@ This test suite covers the actual working features of the JSONExtractor class.
 Based on testing the real behavior of the API.
 """
 
-from typing import Any, Dict, List
+import copy
+from typing import Any, Dict, List, Optional
 
+import jmespath
+import orjson
 import pytest
 
-from app.utils.json_extractor import JSONExtractor
+from app.config.store_config import get_store_config
+from app.utils.json_extractor import _PATTERN_CACHE, JSONExtractor
 
 
 class TestJSONExtractor:
@@ -175,6 +179,61 @@ class TestJSONExtractor:
         ]
         assert result == expected
 
+    def test_wildcard_nested_field_path(self, monkeypatch):
+        """Test wildcard paths with nested fields are compiled once at init."""
+        extractor = JSONExtractor({'data[*].price.amount': True})
+
+        monkeypatch.setattr("app.utils.json_extractor.jmespath.compile", lambda *args: pytest.fail("path recompiled"))
+        result = extractor.extract(self.sample_response)
+
+        amounts = [product['price']['amount'] for product in self.sample_response['data']]
+        assert result == {'data': {'price': {'amount': amounts}}}
+
+    def test_plain_fields_bypass_jmespath(self):
+        """Test that single-key paths are read directly and only dotted paths are compiled."""
+        extractor = JSONExtractor({'name': True, 'brandName': True, 'price.amount': True})
+
+        assert set(extractor._compiled) == {'price.amount'}
+        assert extractor.extract([self.sample_product, 'not-a-dict']) == [
+            {'name': 'Cherry Tomatoes in Tomato Juice 400g', 'brandName': 'CASA BARELLI', 'price': {'amount': 139}},
+            {}
+        ]
+
+    def test_dotted_key_paths_bypass_jmespath(self, monkeypatch):
+        """Test that plain dotted paths are walked key by key, with JMESPath only for real expressions."""
+        compiled = []
+        jmespath_compile = jmespath.compile
+        monkeypatch.setattr("app.utils.json_extractor.jmespath.compile", lambda path: compiled.append(path) or jmespath_compile(path))
+        extractor = JSONExtractor({
+            'availability.store.name': True,
+            'price.amount.value': True,
+            'categories[0].name': True
+        })
+
+        assert compiled == ['categories[0].name']
+        assert extractor.extract(self.sample_product) == {
+            'availability': {'store': {'name': 'ALDI Sydney'}},
+            'categories[0]': {'name': 'Pantry'}
+        }
+
+    def test_wildcard_path_skips_non_dict_items(self):
+        """Test that wildcard paths yield an empty list for non-dict items."""
+        extractor = JSONExtractor({'name': True, 'assets[*].url': True})
+
+        assert extractor.extract([self.sample_product, 'not-a-dict'])[1] == {'assets': {'url': []}}
+
+    def test_flat_field_rules_over_list(self):
+        """Test that rule sets of plain field flags use the flat extraction path."""
+        extractor = JSONExtractor({'sku': True, 'brandName': True, 'missing': True})
+        data = [self.sample_product, {'sku': '1', 'brandName': None}, 'not-a-dict']
+
+        assert extractor._flat_fields == ('sku', 'brandName', 'missing')
+        assert extractor.extract(data) == [
+            {'sku': '000000000000457910', 'brandName': 'CASA BARELLI'},
+            {'sku': '1'},
+            {}
+        ]
+
     def test_mixed_field_extraction(self):
         """Test mixed extraction with fields and sub-rules."""
         rules = {
@@ -201,6 +260,29 @@ class TestJSONExtractor:
         }
         assert result == expected
 
+    def test_mixed_sub_rules_merge_without_mutating_input(self):
+        """Test that sub-rule fields are merged into the extracted array items only."""
+        rules = {
+            'data': {
+                'fields': ['sku'],
+                'limit': 1,
+                'categories[*].name': True,
+                'price': ['amount']
+            }
+        }
+        original = copy.deepcopy(self.sample_response)
+        extractor = JSONExtractor(rules)
+        result = extractor.extract(self.sample_response)
+
+        assert self.sample_response == original
+        assert result == {
+            'data': [{
+                'sku': '000000000000457910',
+                'categories': ['Pantry', 'Canned Food'],
+                'price': {'amount': 139}
+            }]
+        }
+
     def test_complex_nested_extraction(self):
         """Test complex nested extraction with multiple patterns."""
         rules = {
@@ -325,6 +407,28 @@ class TestJSONExtractor:
         }
         assert result == expected
 
+    def test_null_cleanup_does_not_copy_or_mutate(self):
+        """Test that null cleanup only copies containers that held nulls."""
+        data = {
+            'price': {'amount': 139, 'display': None},
+            'assets': [{'url': 'image1.jpg'}]
+        }
+        extractor = JSONExtractor({'price': True, 'assets': True})
+        result = extractor.extract(data)
+
+        assert result == {'price': {'amount': 139}, 'assets': [{'url': 'image1.jpg'}]}
+        assert result['assets'] is data['assets']
+        assert data['price'] == {'amount': 139, 'display': None}
+
+    def test_null_free_deep_nesting_is_not_walked_recursively(self):
+        """Test that null-free values deeper than the recursion limit are extracted."""
+        nested = {'leaf': 1}
+        for _ in range(5000):
+            nested = {'child': nested}
+        extractor = JSONExtractor({'tree': True})
+
+        assert extractor.extract({'tree': nested})['tree'] is nested
+
     def test_limit_array_extraction(self):
         """Test array extraction with limit."""
         data = {
@@ -394,6 +498,74 @@ class TestJSONExtractor:
         }
         assert result == expected
 
+    def test_regex_patterns_compiled_once(self, monkeypatch):
+        """Test that regex rules are compiled at init, not per extracted item."""
+        rules = {
+            'name': {'regex': r'Tomato'},
+            'data': {'fields': ['name'], 'tags': {'regex': r'^fresh'}}
+        }
+        extractor = JSONExtractor(rules)
+        assert {r'Tomato', r'^fresh'} <= set(_PATTERN_CACHE)
+
+        monkeypatch.setattr("app.utils.json_extractor.re.compile", lambda *args: pytest.fail("regex recompiled"))
+        result = extractor.extract([{'name': 'Cherry Tomatoes'}, {'name': 'Banana'}])
+
+        assert result == [{'name': 'Cherry Tomatoes'}, {}]
+
+    def test_extract_bytes_matches_extract(self):
+        """Test that extracting from a raw JSON document matches extracting from parsed data."""
+        rules = {
+            'data[*].name': True,
+            'data[*].price': {'fields': ['amount']}
+        }
+        extractor = JSONExtractor(rules)
+        buf = orjson.dumps(self.sample_response)
+
+        assert extractor.extract_bytes(buf) == extractor.extract(self.sample_response)
+        assert extractor.extract_bytes(buf.decode()) == extractor.extract(self.sample_response)
+
+    def test_store_extractor_is_reused_across_searches(self):
+        """Test that a store builds its extractor once and every search reuses it."""
+        config = get_store_config('aldi')
+
+        assert config.json_extractor is config.json_extractor
+        assert config.json_extractor.extract(self.sample_response)['data'][0]['sku'] == '000000000000457910'
+
+    def test_extract_many_matches_per_item_extraction(self):
+        """Test that batch extraction matches extracting each record on its own."""
+        records = self.sample_response['data'] + ['not-a-dict']
+        for rules in ({'sku': True, 'brandName': True}, {'name': True, 'price': ['amount'], 'categories[*].name': True}):
+            extractor = JSONExtractor(rules)
+
+            assert extractor.extract_many(records) == [extractor.extract(record) for record in records]
+
+    def test_regex_patterns_shared_across_extractors(self, monkeypatch):
+        """Test that a pattern compiled by one extractor is reused by the next."""
+        JSONExtractor({'name': {'regex': r'^Cherry'}})
+
+        monkeypatch.setattr("app.utils.json_extractor.re.compile", lambda *args: pytest.fail("regex recompiled"))
+        result = JSONExtractor({'name': {'regex': r'^Cherry'}}).extract({'name': 'Cherry Tomatoes'})
+
+        assert result == {'name': 'Cherry Tomatoes'}
+
+    def test_rules_classified_once(self, monkeypatch):
+        """Test that rule kinds are decided at init, not per extracted item."""
+        rules = {
+            '@': {'fields': ['sku']},
+            'assets': {'limit': 1, 'fields': ['url']},
+            'name': True
+        }
+        extractor = JSONExtractor(rules)
+
+        monkeypatch.setattr(JSONExtractor, "_is_mixed_instruction", lambda self, instruction: pytest.fail("rule reclassified"))
+        result = extractor.extract([self.sample_product])
+
+        assert result == [{
+            'sku': '000000000000457910',
+            'assets': [{'url': 'https://example.com/image1.jpg'}],
+            'name': 'Cherry Tomatoes in Tomato Juice 400g'
+        }]
+
     def test_unicode_handling(self):
         """Test handling of unicode characters."""
         data = {
@@ -523,5 +695,48 @@ class TestJSONExtractor:
         assert result == expected
 
 
+class TestJSONExtractorModelConversion:
+    """Test suite for converting extracted data into models."""
+
+    rules = {'name': True, 'brandName': True}
+    data = [{'name': 'Cherry Tomatoes', 'brandName': 'CASA BARELLI', 'sku': '457910'}]
+
+    def test_pydantic_model_conversion(self):
+        from pydantic import BaseModel
+
+        class Item(BaseModel):
+            name: str
+            brandName: Optional[str] = None
+
+        result = JSONExtractor(self.rules, model=Item).extract(self.data)
+
+        assert result == [Item(name='Cherry Tomatoes', brandName='CASA BARELLI')]
+
+    def test_null_fields_fall_back_to_model_defaults(self):
+        from pydantic import BaseModel
+
+        class Item(BaseModel):
+            name: str
+            brandName: str = 'Unbranded'
+            tags: list[str] = []
+
+        rules = {'name': True, 'brandName': True, 'tags': True}
+        data = [{'name': 'Cherry Tomatoes', 'brandName': None, 'tags': ['canned', None]}]
+
+        result = JSONExtractor(rules, model=Item).extract(data)
+
+        assert result == [Item(name='Cherry Tomatoes', brandName='Unbranded', tags=['canned'])]
+
+    def test_msgspec_struct_conversion(self):
+        msgspec = pytest.importorskip("msgspec")
+
+        class Item(msgspec.Struct):
+            name: str
+            brandName: Optional[str] = None
+
+        result = JSONExtractor(self.rules, model=Item).extract(self.data[0])
+
+        assert result == Item(name='Cherry Tomatoes', brandName='CASA BARELLI')
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Unit tests for the data models.
+"""
+
+import pytest
+
+from app.models import Ingredient, QuantityUnit
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("tbsp", QuantityUnit.TABLESPOON),
+    ("TBSP", QuantityUnit.TABLESPOON),
+    (" tablespoon ", QuantityUnit.TABLESPOON),
+    ("fl oz", QuantityUnit.FLUID_OUNCE),
+    ("default", QuantityUnit.UNIT),
+    (QuantityUnit.GRAM, QuantityUnit.GRAM),
+    ("handful", QuantityUnit.DEFAULT),
+    (None, QuantityUnit.DEFAULT),
+])
+def test_quantity_unit_from_str(value, expected):
+    """Unit values and names map to units, unknown values fall back to DEFAULT."""
+    assert QuantityUnit.from_str(value) is expected
+
+
+def test_ingredient_coerces_unknown_unit():
+    """Unknown units from the AI do not fail ingredient validation."""
+    ingredient = Ingredient(name="basil", quantity=1, unit="handful", original_text="a handful of basil")
+
+    assert ingredient.unit is QuantityUnit.DEFAULT
+    assert str(ingredient) == "basil: 1.0 unit"
+
+
+def test_ingredient_keeps_missing_unit():
+    """An explicit None unit stays None, as the field is Optional, instead of becoming DEFAULT."""
+    ingredient = Ingredient(name="salt", unit=None, original_text="salt to taste")
+
+    assert ingredient.unit is None
+    assert str(ingredient) == "salt: 1"
@@ -0,0 +1,73 @@
+"""
+Unit tests for the parallel execution utilities.
+"""
+
+import asyncio
+import time
+
+from app.utils.parallel_utils import TokenBucket, gather_with_limit
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket functionality."""
+
+    def test_burst_up_to_capacity_does_not_wait(self):
+        bucket = TokenBucket(rate_per_sec=1.0, capacity=3)
+
+        async def main():
+            for _ in range(3):
+                await bucket.acquire()
+
+        start = time.monotonic()
+        asyncio.run(main())
+
+        assert time.monotonic() - start < 0.1
+
+    def test_acquire_waits_for_refill(self):
+        bucket = TokenBucket(rate_per_sec=20.0)
+
+        async def main():
+            for _ in range(3):
+                await bucket.acquire()
+
+        start = time.monotonic()
+        asyncio.run(main())
+
+        # First token is available immediately, the next two refill at 20/s
+        assert time.monotonic() - start >= 0.09
+
+
+class TestGatherWithLimit:
+    """Test suite for gather_with_limit functionality."""
+
+    def test_results_keep_input_order(self):
+        async def work(value):
+            await asyncio.sleep(0.01 * (5 - value))
+            return value
+
+        results = asyncio.run(gather_with_limit([work(i) for i in range(5)], max_concurrency=2))
+
+        assert results == [0, 1, 2, 3, 4]
+
+    def test_concurrency_limit_is_respected(self):
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        asyncio.run(gather_with_limit([work() for _ in range(6)], max_concurrency=2))
+
+        assert peak == 2
+
+    def test_exceptions_are_returned(self):
+        async def fail():
+            raise ValueError("boom")
+
+        results = asyncio.run(gather_with_limit([fail()], max_concurrency=1, delay=0.01))
+
+        assert isinstance(results[0], ValueError)
@@ -0,0 +1,80 @@
+"""
+Unit tests for the header-aware RateLimitState tracker.
+"""
+
+import time
+
+import pytest
+
+from app.utils.retry_utils import RateLimitState, parse_reset_duration
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("1s", 1.0),
+    ("20ms", 0.02),
+    ("6m0s", 360.0),
+    ("1h2m3.5s", 3723.5),
+    ("30", 30.0),
+    ("", None),
+    (None, None),
+    ("soon", None),
+])
+def test_parse_reset_duration(value, expected):
+    """Reset header values are converted to seconds."""
+    assert parse_reset_duration(value) == expected
+
+
+class TestRateLimitState:
+    """Test suite for RateLimitState functionality."""
+
+    def test_plenty_of_budget_does_not_throttle(self):
+        state = RateLimitState("TEST")
+
+        state.update_from_headers({
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "499",
+            "x-ratelimit-reset-requests": "120ms",
+        })
+
+        assert state.remaining_requests == 499
+        assert state.resume_at == 0.0
+
+    def test_low_remaining_requests_throttles_until_reset(self):
+        state = RateLimitState("TEST")
+
+        state.update_from_headers({
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "2",
+            "x-ratelimit-reset-requests": "6s",
+        })
+
+        assert state.resume_at - time.monotonic() == pytest.approx(6.0, abs=0.5)
+
+    def test_low_token_ratio_throttles_until_token_reset(self):
+        state = RateLimitState("TEST")
+
+        state.update_from_headers({
+            "x-ratelimit-limit-tokens": "10000",
+            "x-ratelimit-remaining-tokens": "500",
+            "x-ratelimit-reset-tokens": "3s",
+        })
+
+        assert state.resume_at - time.monotonic() == pytest.approx(3.0, abs=0.5)
+
+    def test_retry_after_takes_precedence(self):
+        state = RateLimitState("TEST")
+
+        state.update_from_headers({"retry-after": "10"})
+
+        assert state.resume_at - time.monotonic() == pytest.approx(10.0, abs=0.5)
+
+    def test_anthropic_headers(self):
+        state = RateLimitState("TEST")
+
+        state.update_from_headers({
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "40",
+        })
+
+        assert state.limit_requests == 50
+        assert state.remaining_requests == 40
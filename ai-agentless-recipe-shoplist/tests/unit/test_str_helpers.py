@@ -0,0 +1,41 @@
+"""
+Unit tests for string helper functions.
+"""
+
+from app.models import Product
+from app.utils.str_helpers import count_words, object_to_str
+
+
+class TestObjectToStr:
+    """Test suite for object_to_str."""
+
+    def test_strings_are_returned_unchanged(self):
+        text = "<p>Tomato</p>"
+
+        assert object_to_str(text) is text
+
+    def test_models_and_dicts_are_serialized_as_json(self):
+        assert object_to_str(Product.default()) == Product.default().model_dump_json()
+        assert object_to_str({"name": "Tomato", 1: [Product.default()]}) == (
+            '{"name":"Tomato","1":[' + Product.default().model_dump_json() + ']}'
+        )
+
+    def test_unserializable_objects_fall_back_to_str(self):
+        class Plain:
+            def __init__(self):
+                self.value = 1
+
+        assert object_to_str(Plain()) == '{"value":1}'
+        assert object_to_str(2 ** 70) == str(2 ** 70)
+
+
+class TestCountWords:
+    """Test suite for count_words."""
+
+    def test_ascii_text(self):
+        assert count_words("") == 0
+        assert count_words("  2 cups of_flour, sifted.") == 4
+        assert count_words("tomato") == 1
+
+    def test_unicode_text_matches_regex_words(self):
+        assert count_words("jalapeño\u00a0crème-fraîche") == 3
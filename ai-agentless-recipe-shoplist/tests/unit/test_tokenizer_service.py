@@ -0,0 +1,36 @@
+"""
+Unit tests for TokenizerService truncation.
+"""
+
+import app.utils  # noqa: F401  (loads ai_helpers first, which imports tokenizer_service)
+from app.services.tokenizer_service import TokenizerService
+
+
+class ByteEncoding:
+    """Encoding with one token per UTF-8 byte, the worst case for byte-level BPE."""
+
+    def encode(self, text: str) -> list[int]:
+        return list(text.encode("utf-8"))
+
+    def decode(self, tokens: list[int]) -> str:
+        return bytes(tokens).decode("utf-8", errors="ignore")
+
+
+class TestTruncateToTokenLimit:
+    """Test suite for TokenizerService.truncate_to_token_limit."""
+
+    def setup_method(self):
+        self.service = TokenizerService.__new__(TokenizerService)
+        self.service.name = "TokenizerService"
+        self.service.tokenizer = ByteEncoding()
+
+    def test_short_ascii_text_is_returned_unchanged(self):
+        assert self.service.truncate_to_token_limit("2 cups flour", 12) == "2 cups flour"
+
+    def test_short_non_ascii_text_over_the_limit_is_truncated(self):
+        text = "番茄" * 3
+
+        result = self.service.truncate_to_token_limit(text, 12)
+
+        assert result == "番茄番茄"
+        assert len(self.service.tokenizer.encode(result)) <= 12